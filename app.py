@@ -1,17 +1,26 @@
 import os
-import glob
-import subprocess
+import uuid
 import logging
+import threading
+import functools
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from flask import Flask, request, jsonify
 import pandas as pd
-import sys
+
+try:
+    import fcntl
+except ImportError:  # no flock (Windows): merges from parallel jobs are not serialised
+    fcntl = None
 
 from preprocessor.cleaner_products import preprocess_product_file
 from preprocessor.cleaner_features import preprocess_feature_file
 from preprocessor.cleaner_faqs import preprocess_faq_file
 from preprocessor.cleaner_specifications import preprocess_specification_file
 from preprocessor.cleaner_reviews import preprocess_review_file
+from preprocessor.csv_io import read_csv, write_csv, append_csv
+from scrapers import boat_scraper, boult_scraper, noise_scraper
 
 # ----- Flask App -----
 app = Flask(__name__)
@@ -22,15 +31,33 @@ CATEGORIES_CSV = 'categories.csv'
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_FOLDER = os.path.join(BASE_DIR, 'data')
 MERGED_FOLDER = os.path.join(BASE_DIR, 'merged_data')
-
-PYTHON_PATH = sys.executable
-
-SCRIPTS = {
-    "boat": os.path.join(BASE_DIR, "scrapers/boat_scraper.py"),
-    "boult": os.path.join(BASE_DIR, "scrapers/boult_scraper.py"),
-    "noise": os.path.join(BASE_DIR, "scrapers/noise_scraper.py")
+# "csv" (default) or "parquet"; parquet suits in-process downstream readers
+MERGED_FORMAT = os.environ.get("MERGED_FORMAT", "csv").lower()
+
+# brand -> scrape(url, category_id, brand) returning {table name: DataFrame}
+SCRAPERS = {
+    "boat": boat_scraper.scrape,
+    "boult": boult_scraper.scrape,
+    "noise": noise_scraper.scrape
 }
 
+# (response key, cleaner, table name) - each writes to its own merged file
+CLEAN_JOBS = [
+    ("cleaned_product_files", preprocess_product_file, "products"),
+    ("cleaned_feature_files", preprocess_feature_file, "features"),
+    ("cleaned_faq_files", preprocess_faq_file, "faqs"),
+    ("cleaned_specification_files", preprocess_specification_file, "specifications"),
+    ("cleaned_review_files", preprocess_review_file, "reviews"),
+]
+
+# ----- Scrape Job Pool -----
+SCRAPE_WORKERS = int(os.environ.get("SCRAPE_WORKERS", os.cpu_count() or 1))
+EXECUTOR = ProcessPoolExecutor(max_workers=SCRAPE_WORKERS)
+JOBS = {}  # job_id -> Future
+JOBS_LOCK = threading.Lock()
+CATEGORIES_LOCK = threading.Lock()  # guards categories.csv writes and _IN_FLIGHT
+_IN_FLIGHT = set()  # (brand, url, category_id) of /scrape-next jobs still running
+
 # ----- Logging -----
 logging.basicConfig(
     filename=LOG_FILE,
@@ -39,59 +66,192 @@ logging.basicConfig(
 )
 
 # ----- Utility: Merge Data -----
-def append_to_merged(file_path, brand):
-    """Append cleaned data to merged CSV, drop duplicates, and sort by category_id."""
+# Merged frames are held in memory until written once by flush_merged_path()
+# (or flush_merged() for a whole brand); each file type owns its own merged_path key.
+# Tables without category_id are appended straight to an existing CSV
+# instead; each scrape job ends with compact_merged() dropping the duplicates
+# that leaves behind.
+_MERGED_CACHE = {}  # merged_path -> DataFrame
+_MERGED_DIRTY = set()
+_MERGED_APPENDED = set()  # merged CSVs grown by append_csv since their last compaction
+
+def append_to_merged(new_df, file_path, brand):
+    """
+    Append a cleaned frame to the in-memory merged frame; returns its merged_path until written out.
+    file_path is the per-category file new_df was saved to; it only names the merged file.
+    """
     try:
         filename = os.path.basename(file_path)
         file_type = filename.split('_')[-1]  # e.g., products.csv
         merged_dir = os.path.join(MERGED_FOLDER, f"{brand}_merged")
         os.makedirs(merged_dir, exist_ok=True)
+        if MERGED_FORMAT == "parquet":
+            file_type = os.path.splitext(file_type)[0] + ".parquet"
         merged_path = os.path.join(merged_dir, f"{brand}_{file_type}")
 
-        new_df = pd.read_csv(file_path)
-
-        if os.path.exists(merged_path):
-            existing_df = pd.read_csv(merged_path)
-            combined_df = pd.concat([existing_df, new_df], ignore_index=True)
+        if (MERGED_FORMAT == "csv" and merged_path not in _MERGED_CACHE
+                and 'category_id' not in new_df.columns and os.path.exists(merged_path)
+                and list(pd.read_csv(merged_path, nrows=0).columns) == list(new_df.columns)):
+            append_csv(new_df, merged_path)
+            _MERGED_APPENDED.add(merged_path)
+            logging.info(f"[MERGE] Appended {len(new_df)} rows from {file_path} to {merged_path}")
+            return None
+
+        if merged_path in _MERGED_CACHE:
+            _MERGED_CACHE[merged_path] = pd.concat([_MERGED_CACHE[merged_path], new_df], ignore_index=True)
+        elif os.path.exists(merged_path):
+            if MERGED_FORMAT == "parquet":
+                existing_df = pd.read_parquet(merged_path)
+            else:
+                existing_df = read_csv(merged_path)
+            _MERGED_CACHE[merged_path] = pd.concat([existing_df, new_df], ignore_index=True)
         else:
-            combined_df = new_df
+            _MERGED_CACHE[merged_path] = new_df
+
+        _MERGED_DIRTY.add(merged_path)
+        logging.info(f"[MERGE] Queued {file_path} for {merged_path}")
+        return merged_path
 
-        combined_df.drop_duplicates(inplace=True)
-        if 'category_id' in combined_df.columns:
-            combined_df.sort_values(by='category_id', inplace=True)
+    except Exception:
+        logging.exception(f"[MERGE ERROR] Failed to merge {file_path}")
+        return None
+
+def _write_merged(combined_df, merged_path):
+    """Drop duplicate rows, sort by category_id if needed and write a merged file."""
+    # Whole rows, not product_id: ids are list positions ("category_1_product_3"),
+    # so one id names different products across scrapes
+    combined_df.drop_duplicates(inplace=True, ignore_index=True)
+
+    # New rows usually arrive in category order already; skip the sort then
+    if 'category_id' in combined_df.columns and not combined_df['category_id'].is_monotonic_increasing:
+        combined_df.sort_values(by='category_id', inplace=True)
+
+    if MERGED_FORMAT == "parquet":
+        combined_df.to_parquet(merged_path, index=False)
+    else:
+        write_csv(combined_df, merged_path)
 
-        combined_df.to_csv(merged_path, index=False)
+def flush_merged_path(merged_path):
+    """Write one pending merged file."""
+    try:
+        _MERGED_DIRTY.discard(merged_path)
+        _write_merged(_MERGED_CACHE.pop(merged_path), merged_path)
         logging.info(f"[MERGE] Successfully merged into {merged_path}")
 
     except Exception:
-        logging.exception(f"[MERGE ERROR] Failed to merge {file_path}")
+        logging.exception(f"[MERGE ERROR] Failed to write {merged_path}")
+
+def flush_merged(brand):
+    """Write every pending merged file for a brand."""
+    merged_dir = os.path.join(MERGED_FOLDER, f"{brand}_merged")
+
+    for merged_path in [p for p in _MERGED_DIRTY if os.path.dirname(p) == merged_dir]:
+        flush_merged_path(merged_path)
+
+def compact_merged(brand, appended_only=False):
+    """
+    Re-read a brand's merged CSVs and rewrite them deduplicated; undoes append-only growth.
+    With appended_only, only the files this process appended to since their last compaction.
+    """
+    merged_dir = os.path.join(MERGED_FOLDER, f"{brand}_merged")
+    compacted = []
+    if MERGED_FORMAT != "csv" or not os.path.isdir(merged_dir):
+        return compacted
+
+    for filename in sorted(os.listdir(merged_dir)):
+        if not filename.endswith(".csv"):
+            continue
+        merged_path = os.path.join(merged_dir, filename)
+        if appended_only and merged_path not in _MERGED_APPENDED:
+            continue
+        try:
+            _write_merged(read_csv(merged_path), merged_path)
+            _MERGED_APPENDED.discard(merged_path)
+            compacted.append(filename)
+            logging.info(f"[COMPACT] Rewrote {merged_path}")
+        except Exception:
+            logging.exception(f"[COMPACT ERROR] Failed to compact {merged_path}")
+    return compacted
+
+def _run_compaction(brands):
+    """Compact the merged files of each brand. Executed in an EXECUTOR worker process."""
+    compacted = {}
+    for brand in brands:
+        with merge_lock(brand):
+            compacted[brand] = compact_merged(brand)
+    return {"status": "success", "compacted": compacted}
+
+@contextmanager
+def merge_lock(brand):
+    """
+    Hold an exclusive flock on the brand's merged folder while its files are
+    read and rewritten, so parallel scrape jobs do not overwrite each other.
+    """
+    merged_dir = os.path.join(MERGED_FOLDER, f"{brand}_merged")
+    os.makedirs(merged_dir, exist_ok=True)
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(merged_dir, ".merge.lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)  # released when the file is closed
+        yield
 
 # ----- Utility: Clean & Merge Files -----
-def clean_and_merge(brand, cleaner_fn, pattern):
-    """Clean files using provided cleaner function and append to merged file."""
-    cleaned_files = []
-    brand_path = os.path.join(DATA_FOLDER, brand)
-    files = glob.glob(os.path.join(brand_path, pattern))
+def clean_and_merge(brand, cleaner_fn, file_path, raw_df, flush=False):
+    """
+    Clean a scraped table, save it to file_path and append it to the merged file.
+    With flush=True the merged file is written right away, from the calling thread.
+    """
+    try:
+        df = cleaner_fn(raw_df)
+        if df is None:
+            logging.warning(f"[{brand}] Cleaner returned None for {file_path}")
+            return []
 
-    logging.debug(f"[{brand}] Found files: {files}")
+        write_csv(df, file_path)
+        merged_path = append_to_merged(df, file_path, brand)
+        if flush and merged_path:
+            flush_merged_path(merged_path)
 
-    for file_path in files:
-        try:
-            df = cleaner_fn(file_path)
-            if df is None:
-                logging.warning(f"[{brand}] Cleaner returned None for {file_path}")
-                continue
+        logging.info(f"[{brand}] Cleaned & merged {file_path}")
+        return [os.path.basename(file_path)]
 
-            df.to_csv(file_path, index=False)
-            cleaned_files.append(os.path.basename(file_path))
-            append_to_merged(file_path, brand)
+    except Exception:
+        logging.exception(f"[{brand}] Failed to clean or merge {file_path}")
+        return []
 
-            logging.info(f"[{brand}] Cleaned & merged {file_path}")
+# ----- Worker: Scrape, Clean & Merge -----
+def _run_scraper(brand, url, category_id):
+    """Run the brand scraper in-process and clean/merge its tables. Executed in an EXECUTOR worker process."""
+    try:
+        tables = SCRAPERS[brand](url, category_id, brand)
+    except Exception as e:
+        logging.exception(f"Scraping failed for {brand}")
+        return {"status": "error", "error": str(e)}
 
-        except Exception:
-            logging.exception(f"[{brand}] Failed to clean or merge {file_path}")
+    logging.info(f"Scraping completed for {brand}")
 
-    return cleaned_files
+    response_data = {
+        "status": "success",
+        "message": f"Scraping for '{brand}' completed.",
+        "scraped_rows": {name: len(df) for name, df in tables.items()},
+    }
+
+    # File types are independent and each owns its merged file, so clean and
+    # write them concurrently; one table's disk I/O overlaps another's cleaning
+    brand_path = os.path.join(DATA_FOLDER, brand)
+    with merge_lock(brand), ThreadPoolExecutor(max_workers=len(CLEAN_JOBS)) as ex:
+        futures = {
+            ex.submit(clean_and_merge, brand, cleaner_fn,
+                      os.path.join(brand_path, f"{brand}_{category_id}_{table}.csv"), tables[table], True): key
+            for key, cleaner_fn, table in CLEAN_JOBS
+        }
+        for future in as_completed(futures):
+            response_data[futures[future]] = future.result()
+        # Still under the merge lock: drop the rows this job's appends duplicated
+        response_data["compacted_files"] = compact_merged(brand, appended_only=True)
+
+    return response_data
 
 # ----- Endpoint: Scrape Specific -----
 @app.route("/scrape", methods=["POST"])
@@ -106,38 +266,85 @@ def scrape():
     if not brand or not url or not category_id:
         return jsonify({"error": "Missing required fields: brand, url, category_id"}), 400
 
-    script_path = SCRIPTS.get(brand)
-    if not script_path:
+    if brand not in SCRAPERS:
         return jsonify({"error": f"Invalid brand '{brand}'"}), 400
 
     os.makedirs(os.path.join(DATA_FOLDER, brand), exist_ok=True)
 
+    job_id = uuid.uuid4().hex
+    future = EXECUTOR.submit(_run_scraper, brand, url, str(category_id))
+    with JOBS_LOCK:
+        JOBS[job_id] = future
+
+    logging.info(f"Queued scrape job {job_id} for {brand}")
+    return jsonify({"job_id": job_id}), 202
+
+# ----- Endpoint: Scrape Job Status -----
+@app.route("/scrape-status/<job_id>", methods=["GET"])
+def scrape_status(job_id):
+    with JOBS_LOCK:
+        future = JOBS.get(job_id)
+
+    if future is None:
+        return jsonify({"error": f"Unknown job '{job_id}'"}), 404
+
+    if not future.done():
+        return jsonify({"job_id": job_id, "status": "running"}), 200
+
     try:
-        # Run scraper subprocess
-        result = subprocess.run(
-            [PYTHON_PATH, script_path, "--url", url, "--category_id", str(category_id), "--brand", brand],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        logging.info(f"Scraping completed for {brand}")
-
-        response_data = {
-            "status": "success",
-            "message": f"Scraping for '{brand}' completed.",
-            "cleaned_product_files": clean_and_merge(brand, preprocess_product_file, "*_products.csv"),
-            "cleaned_feature_files": clean_and_merge(brand, preprocess_feature_file, "*_features.csv"),
-            "cleaned_faq_files": clean_and_merge(brand, preprocess_faq_file, "*_faqs.csv"),
-            "cleaned_specification_files": clean_and_merge(brand, preprocess_specification_file, "*_specifications.csv"),
-            "cleaned_review_files": clean_and_merge(brand, preprocess_review_file, "*_reviews.csv"),
-            "script_output": result.stdout.strip()
-        }
-        return jsonify(response_data), 200
+        result = future.result()
+    except Exception as e:
+        logging.exception(f"Scrape job {job_id} crashed")
+        return jsonify({"job_id": job_id, "status": "error", "error": str(e)}), 500
+
+    status_code = 200 if result.get("status") == "success" else 500
+    return jsonify({"job_id": job_id, **result}), status_code
+
+# ----- Endpoint: Compact Merged Files -----
+@app.route("/compact-merged", methods=["POST"])
+def compact():
+    data = request.get_json(silent=True) or {}
+    brand = data.get("brand", "").lower()
+
+    if brand and brand not in SCRAPERS:
+        return jsonify({"error": f"Invalid brand '{brand}'"}), 400
+
+    job_id = uuid.uuid4().hex
+    future = EXECUTOR.submit(_run_compaction, [brand] if brand else list(SCRAPERS))
+    with JOBS_LOCK:
+        JOBS[job_id] = future
 
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Scraping failed for {brand}: {e.stderr.strip()}")
-        return jsonify({"status": "error", "error": e.stderr.strip()}), 500
+    logging.info(f"Queued compaction job {job_id}")
+    return jsonify({"job_id": job_id}), 202
+
+@functools.lru_cache(maxsize=4)
+def _load_categories(path, mtime_ns):
+    """Parse categories.csv; keyed on mtime_ns so a rewrite of the file invalidates it."""
+    df = pd.read_csv(path)
+    df['last_scraped'] = pd.to_datetime(df.get('last_scraped', pd.NaT), errors='coerce')
+    return df
+
+def _category_keys(df):
+    return list(zip(df['brand'], df['url'], df['category_id'].astype(str)))
+
+def _record_scrape_result(key, future):
+    """Set a categories.csv row's last_scraped to today if its job succeeded, clear it if it failed."""
+    try:
+        succeeded = future.result().get("status") == "success"
+    except Exception:
+        succeeded = False
+
+    with CATEGORIES_LOCK:
+        _IN_FLIGHT.discard(key)
+        try:
+            # Cached per file version; copy since the row gets marked below
+            df = _load_categories(CATEGORIES_CSV, os.stat(CATEGORIES_CSV).st_mtime_ns).copy()
+            match = [k == key for k in _category_keys(df)]
+            df.loc[match, 'last_scraped'] = pd.Timestamp(datetime.today().date()) if succeeded else pd.NaT
+            df.to_csv(CATEGORIES_CSV, index=False)
+            logging.info(f"{'Updated' if succeeded else 'Cleared'} last_scraped for {key[1]}")
+        except Exception:
+            logging.exception(f"Failed to record scrape result for {key[1]}")
 
 # ----- Endpoint: Scrape Next Row -----
 @app.route("/scrape-next", methods=["POST"])
@@ -145,15 +352,18 @@ def scrape_next():
     if not os.path.exists(CATEGORIES_CSV):
         return jsonify({"error": "categories.csv not found"}), 500
 
-    df = pd.read_csv(CATEGORIES_CSV)
-    df['last_scraped'] = pd.to_datetime(df.get('last_scraped', pd.NaT), errors='coerce')
     today = pd.Timestamp(datetime.today().date())
+    with CATEGORIES_LOCK:
+        df = _load_categories(CATEGORIES_CSV, os.stat(CATEGORIES_CSV).st_mtime_ns)
+        # Rows whose job is still running are skipped so a polling client does not queue them twice
+        idle = pd.Series([key not in _IN_FLIGHT for key in _category_keys(df)], index=df.index)
+        next_row = df[(df['last_scraped'] != today) & idle].head(1)
+        if next_row.empty:
+            return '', 204
+        row = next_row.iloc[0]
+        key = _category_keys(next_row)[0]
+        _IN_FLIGHT.add(key)
 
-    next_row = df[df['last_scraped'] != today].head(1)
-    if next_row.empty:
-        return '', 204
-
-    row = next_row.iloc[0]
     request_data = {"brand": row['brand'], "url": row['url'], "category_id": row['category_id']}
 
     logging.info(f"Dispatching next scrape: {request_data}")
@@ -164,22 +374,27 @@ def scrape_next():
     try:
         response_data, status_code = scrape_response
     except Exception:
+        with CATEGORIES_LOCK:
+            _IN_FLIGHT.discard(key)
         logging.exception("Failed to parse scrape response.")
         return jsonify({"error": "Internal scraping error"}), 500
 
-    if status_code == 200:
-        df.at[next_row.index[0], 'last_scraped'] = today
-        df.to_csv(CATEGORIES_CSV, index=False)
-        logging.info(f"Updated last_scraped for {row['url']}")
-        return response_data, 200
+    if status_code == 202:
+        # last_scraped is recorded from the job's result, not on dispatch
+        with JOBS_LOCK:
+            future = JOBS[response_data.get_json()["job_id"]]
+        future.add_done_callback(functools.partial(_record_scrape_result, key))
+        return response_data, 202
     else:
+        with CATEGORIES_LOCK:
+            _IN_FLIGHT.discard(key)
         logging.error(f"Scrape failed: {response_data.get_json()}")
         return jsonify({"error": "Scrape failed", "details": response_data.get_json()}), 500
 
 # ----- Health Check -----
 @app.route("/")
 def home():
-    return "<h2>Web Scraping API is live</h2><p>Use POST /scrape or /scrape-next</p>"
+    return "<h2>Web Scraping API is live</h2><p>Use POST /scrape, /scrape-next or /compact-merged, then GET /scrape-status/&lt;job_id&gt;</p>"
 
 # ----- Run App -----
 if __name__ == "__main__":
@@ -1,13 +1,21 @@
 import pandas as pd
 import re
 import logging
+from typing import Union
+
+from preprocessor.csv_io import as_text, load_frame, source_name
 
 # Setup module-level logger
 logger = logging.getLogger(__name__)
 
-def preprocess_faq_file(file_path: str) -> pd.DataFrame:
+_LEADING_Q = re.compile(r'^q\s*')
+_PUNCTUATION = re.compile(r"[^a-z0-9\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+def preprocess_faq_file(source: Union[str, pd.DataFrame]) -> pd.DataFrame:
     """
     Universal FAQ CSV preprocessor for boAt, Noise, and Boult brands.
+    Accepts a CSV path or an in-memory DataFrame from a scraper.
     - Drops rows where 'question' or 'answer' is null or empty
     - Fixes encoding issues (e.g., &amp;)
     - Removes leading 'q '
@@ -16,8 +24,9 @@ def preprocess_faq_file(file_path: str) -> pd.DataFrame:
     - Strips whitespace
     - Ensures no rows remain empty after cleaning
     """
+    file_path = source_name(source)
     try:
-        df = pd.read_csv(file_path)
+        df = load_frame(source)
         logger.info(f"Loaded FAQ file: {file_path} with {len(df)} rows")
     except Exception as e:
         logger.error(f"Failed to load FAQ file {file_path}: {e}")
@@ -33,18 +42,12 @@ def preprocess_faq_file(file_path: str) -> pd.DataFrame:
     original_len = len(df)
     df.dropna(subset=['question', 'answer'], inplace=True)
 
-    # Clean text function
-    def clean_text(text: str) -> str:
-        text = str(text)
-        text = text.replace("&amp;", "&")
-        text = text.lower()
-        text = re.sub(r'^q\s*', '', text)           # remove leading "q "
-        text = re.sub(r"[^a-zA-Z0-9\s]", "", text)  # remove punctuations
-        text = re.sub(r"\s+", " ", text).strip()    # normalize whitespace
-        return text
-
-    df['question'] = df['question'].apply(clean_text)
-    df['answer']   = df['answer'].apply(clean_text)
+    # Clean text (vectorized)
+    for col in ('question', 'answer'):
+        s = as_text(df[col]).str.replace("&amp;", "&", regex=False).str.lower()
+        s = s.str.replace(_LEADING_Q, '', regex=True)      # remove leading "q "
+        s = s.str.replace(_PUNCTUATION, '', regex=True)    # remove punctuations
+        df[col] = s.str.replace(_WHITESPACE, ' ', regex=True).str.strip()  # normalize whitespace
 
     # Drop rows that became empty after cleaning
     cleaned_len_before = len(df)
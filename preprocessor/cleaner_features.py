@@ -1,10 +1,17 @@
 import pandas as pd
 import logging
 import re
+from typing import Union
+
+from preprocessor.csv_io import as_text, load_frame, source_name
 
 logger = logging.getLogger(__name__)
 
-def preprocess_feature_file(file_path: str) -> pd.DataFrame:
+# Encoded '&' and the mojibake degree sign go the same way as every other
+# punctuation run, so one pass strips them all
+_FEATURE_JUNK = re.compile(r"&amp;|Â°|[^\w\s]+")
+
+def preprocess_feature_file(source: Union[str, pd.DataFrame]) -> pd.DataFrame:
     """
     Universal features CSV preprocessor for boAt, Noise, and Boult brands.
     - Fixes encoding issues (e.g., Â°, &amp;)
@@ -14,27 +21,24 @@ def preprocess_feature_file(file_path: str) -> pd.DataFrame:
     - Drops duplicate features per product_id
 
     Args:
-        file_path (str): Path to the CSV file
+        source (str | pd.DataFrame): Path to the CSV file or scraped DataFrame
 
     Returns:
         pd.DataFrame: Cleaned feature data
     """
+    file_path = source_name(source)
     try:
-        df = pd.read_csv(file_path)
+        df = load_frame(source)
         df.columns = df.columns.str.strip()
 
         if 'feature' not in df.columns:
             logger.warning(f"Missing 'feature' column in {file_path}")
             return df
 
-        df['feature'] = df['feature'].astype(str)
-        df['feature'] = df['feature'].str.replace("Â°", "°", regex=False)
-        df['feature'] = df['feature'].str.replace("&amp;", "&", regex=False)
-
         df['feature'] = (
-            df['feature']
+            as_text(df['feature'])
+            .str.replace(_FEATURE_JUNK, "", regex=True)
             .str.lower()
-            .str.replace(r"[^\w\s]", "", regex=True)
             .str.strip()
         )
 
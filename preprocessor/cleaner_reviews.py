@@ -1,20 +1,12 @@
 import pandas as pd
-import nltk
 import re
-from nltk.tokenize import word_tokenize
-from pathlib import Path
+from typing import Union
 
-# --- NLTK Setup (cross-platform safe) ---
-project_root = Path(__file__).resolve().parent.parent
-nltk_data_dir = project_root / "nltk_data"
-nltk.data.path.append(str(nltk_data_dir))
+from preprocessor.csv_io import as_text, load_frame
 
-# Ensure punkt and punkt_tab are available
-for resource in ["punkt", "punkt_tab"]:
-    try:
-        nltk.data.find(f"tokenizers/{resource}")
-    except LookupError:
-        nltk.download(resource, download_dir=nltk_data_dir, quiet=True)
+# Everything but lowercase alphanumerics and whitespace; this also covers
+# emoji, so no separate emoji pass is needed
+_NON_ALNUM = re.compile(r'[^a-z0-9\s]')
 
 
 # def preprocess_review_file(file_path: str) -> pd.DataFrame:
@@ -86,22 +78,22 @@ for resource in ["punkt", "punkt_tab"]:
 
 
 
-def preprocess_review_file(file_path: str) -> pd.DataFrame:
+def preprocess_review_file(source: Union[str, pd.DataFrame]) -> pd.DataFrame:
     """
     Universal review CSV preprocessor for boAt, Noise, and Boult review data.
 
     Cleans and normalizes the review content:
     - Fills missing 'title' using mode
     - Removes emojis and special characters from text fields
-    - Converts to lowercase and tokenizes using NLTK
+    - Converts to lowercase and normalizes whitespace between words
 
     Args:
-        file_path (str): Path to the review CSV file
+        source (str | pd.DataFrame): Path to the review CSV file or scraped DataFrame
 
     Returns:
         pd.DataFrame: Cleaned review DataFrame
     """
-    df = pd.read_csv(file_path)
+    df = load_frame(source)
 
     # Fill missing 'title' with mode if available
     if 'title' in df.columns and df['title'].isnull().any():
@@ -109,38 +101,16 @@ def preprocess_review_file(file_path: str) -> pd.DataFrame:
         if not mode_title.empty:
             df['title'] = df['title'].fillna(mode_title[0])
 
-    # Compile emoji pattern for removal
-    emoji_pattern = re.compile(
-        "["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport & map symbols
-        u"\U0001F1E0-\U0001F1FF"  # flags
-        u"\U00002700-\U000027BF"  # dingbats
-        u"\U0001F900-\U0001F9FF"  # supplemental symbols
-        u"\U0001FA70-\U0001FAFF"  # extended symbols
-        u"\U00002600-\U000026FF"  # misc symbols
-        u"\U00002B00-\U00002BFF"  # arrows
-        u"\u200d"                  # zero width joiner
-        u"\u2640-\u2642"          # gender symbols
-        "]+", flags=re.UNICODE
-    )
-
-    def clean_text(text: str) -> str:
-        if pd.isna(text):
-            return ""
-        text = text.lower()
-        text = emoji_pattern.sub('', text)
-        text = re.sub(r'[^a-zA-Z0-9\s]', '', text)
-        words = word_tokenize(text)
-        return ' '.join(words)
-
+    # Lowercase, strip special characters and normalize whitespace column-wise;
+    # once only alphanumerics remain, whitespace splitting is all tokenizing does
     for col in ['title', 'body', 'author']:
         if col in df.columns:
-            df[col] = df[col].apply(clean_text)
+            text = as_text(df[col]).str.lower()
+            df[col] = text.str.replace(_NON_ALNUM, '', regex=True).str.split().str.join(' ')
 
-    # Drop empty or whitespace-only review bodies
+    # Drop empty review bodies; whitespace was already collapsed above, so
+    # whitespace-only bodies are empty strings by now
     if 'body' in df.columns:
-        df = df[df['body'].str.strip().ne('')].reset_index(drop=True)
+        df = df.loc[df['body'].str.len().to_numpy() > 0]
 
     return df
@@ -1,8 +1,39 @@
 import pandas as pd
 import re
+import functools
 import html
+from typing import Union
 
-def preprocess_specification_file(file_path: str) -> pd.DataFrame:
+from preprocessor.csv_io import as_text, load_frame
+
+# NBSP / zero-width space -> plain space
+_TRANS = str.maketrans({'\xa0': ' ', '\u200b': ' '})
+
+# All clean_text rewrites in one scan: separators (x, ×, +) and digit/letter
+# boundaries become a space, any other special character is dropped
+_FUSED = re.compile(
+    r'(?P<sep>\s*[xX\u00D7+]\s*)'
+    r'|(?P<d2a>(?<=\d)(?=[a-zA-Z]))'
+    r'|(?P<a2d>(?<=[a-zA-Z])(?=\d))'
+    r'|(?P<junk>[^a-zA-Z0-9\s])'
+)
+
+
+def _replace(match: re.Match) -> str:
+    return '' if match.lastgroup == 'junk' else ' '
+
+
+# Spec keys and values repeat heavily across products; cache per distinct cell
+@functools.lru_cache(maxsize=200_000)
+def clean_text(text) -> str:
+    if pd.isna(text):
+        return ''
+    text = html.unescape(str(text).lower()).translate(_TRANS)
+    # split/join collapses and strips whitespace, including runs the sub just created
+    return ' '.join(_FUSED.sub(_replace, text).split())
+
+
+def preprocess_specification_file(source: Union[str, pd.DataFrame]) -> pd.DataFrame:
     """
     Universal cleaner for boAt, Boult, and Noise specification CSVs.
 
@@ -15,12 +46,12 @@ def preprocess_specification_file(file_path: str) -> pd.DataFrame:
     - Normalizes whitespace
 
     Args:
-        file_path (str): Path to the specification CSV
+        source (str | pd.DataFrame): Path to the specification CSV or scraped DataFrame
 
     Returns:
         pd.DataFrame: Cleaned specification data
     """
-    df = pd.read_csv(file_path)
+    df = load_frame(source)
     df.columns = df.columns.str.strip().str.lower()
 
     # Standardize column names
@@ -34,20 +65,8 @@ def preprocess_specification_file(file_path: str) -> pd.DataFrame:
             column_map[col] = 'value'
     df.rename(columns=column_map, inplace=True)
 
-    def clean_text(text: str) -> str:
-        if pd.isna(text):
-            return ''
-        text = str(text).lower().strip()
-        text = html.unescape(text)
-        text = text.replace('\xa0', ' ').replace('\u200b', ' ')
-        text = re.sub(r'\s*[xX\u00D7+]\s*', ' ', text)
-        text = re.sub(r'(?<=\d)(?=[a-zA-Z])', ' ', text)
-        text = re.sub(r'(?<=[a-zA-Z])(?=\d)', ' ', text)
-        text = re.sub(r'[^a-zA-Z0-9\s]', '', text)
-        return re.sub(r'\s+', ' ', text).strip()
-
     for col in ['key', 'value']:
         if col in df.columns:
-            df[col] = df[col].fillna('').apply(clean_text)
+            df[col] = as_text(df[col]).map(clean_text)
 
     return df
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # fall back to pandas' own parser and writer
+    pa = pacsv = None
+
+# Placeholders pandas' CSV reader turns into missing values (its default na_values)
+_NA_STRINGS = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+if pa is not None:
+    _CONVERT_OPTIONS = pacsv.ConvertOptions(null_values=_NA_STRINGS, strings_can_be_null=True)
+
+
+def read_csv(file_path) -> pd.DataFrame:
+    """
+    Read a CSV with the multi-threaded PyArrow parser.
+
+    Columns come back as ordinary NumPy-backed pandas columns. The cleaners'
+    patterns rely on Python re semantics (Unicode \\w, compiled patterns),
+    which Arrow's RE2-based string kernels do not share.
+    """
+    if pa is None:
+        return pd.read_csv(file_path)
+    table = pacsv.read_csv(str(file_path), read_options=pacsv.ReadOptions(use_threads=True),
+                           convert_options=_CONVERT_OPTIONS)
+    return table.to_pandas()
+
+
+def write_csv(df: pd.DataFrame, file_path) -> None:
+    """Write a DataFrame (without its index) through PyArrow's CSV writer."""
+    if pa is None:
+        df.to_csv(file_path, index=False)
+        return
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(file_path))
+
+
+def append_csv(df: pd.DataFrame, file_path) -> None:
+    """Append rows (no header) to an existing CSV written by write_csv."""
+    if pa is None:
+        df.to_csv(file_path, mode="a", header=False, index=False)
+        return
+    with open(file_path, "ab") as f:
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), f,
+                        write_options=pacsv.WriteOptions(include_header=False))
+
+
+def load_frame(source, reader=read_csv) -> pd.DataFrame:
+    """
+    Return the DataFrame a cleaner should work on.
+
+    Paths are read with `reader`. In-memory frames handed over by a
+    scraper are copied and normalized the way a CSV round trip would
+    (placeholder strings become NaN, all-number columns become numeric).
+    """
+    if isinstance(source, pd.DataFrame):
+        return source.replace(_NA_STRINGS, np.nan).infer_objects()
+    return reader(source)
+
+
+def as_text(series: pd.Series) -> pd.Series:
+    """Object-dtype strings for the str methods, with missing values as "" rather than "nan"."""
+    if pd.api.types.infer_dtype(series, skipna=False) == "string":
+        return series
+    return series.astype(str).where(series.notna(), "")
+
+
+def source_name(source) -> str:
+    """Printable name of a cleaner input for log messages."""
+    return "<in-memory frame>" if isinstance(source, pd.DataFrame) else str(source)
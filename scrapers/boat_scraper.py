@@ -1,27 +1,43 @@
 import os
-import csv
+import functools
+import json
 import time
-import platform
 import argparse
+import queue
+import atexit
 import logging
 import tempfile
 import shutil
-import subprocess
+import signal
+import pandas as pd
+from contextlib import contextmanager, ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, WebDriverException
-
-# Import only on Windows
-if platform.system().lower() == 'windows':
-    from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import NoSuchElementException, WebDriverException, TimeoutException
+
+try:
+    from scrapers.driver_pool import DriverPool
+    from scrapers.csv_sink import OUTPUT_FORMATS, open_sink
+    from scrapers.browser import (CHROME_PREFS, CHROME_BIN, CHROMEDRIVER_BIN, IS_LINUX, block_heavy_resources,
+                                  ensure_executable, first_element, managed_driver_path)
+    from scrapers.disk_cache import cache_args, claim_cache_dir
+except ImportError:  # run as a script: python scrapers/<brand>_scraper.py
+    from driver_pool import DriverPool
+    from csv_sink import OUTPUT_FORMATS, open_sink
+    from browser import (CHROME_PREFS, CHROME_BIN, CHROMEDRIVER_BIN, IS_LINUX, block_heavy_resources,
+                         ensure_executable, first_element, managed_driver_path)
+    from disk_cache import cache_args, claim_cache_dir
 
 # ========== Logging Setup ==========
 logger = logging.getLogger("boat_scraper")
-logger.setLevel(logging.DEBUG)
+# DEBUG records are only built when SCRAPER_LOG_LEVEL=DEBUG
+logger.setLevel(os.environ.get("SCRAPER_LOG_LEVEL", "INFO").upper())
 
 formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
@@ -29,48 +45,106 @@ os.makedirs("logs", exist_ok=True)
 file_handler = logging.FileHandler("logs/boat_scraper.log")
 file_handler.setLevel(logging.DEBUG)
 file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
 
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
 console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
 
-# ========== Zombie Chrome Killer ==========
-def kill_zombie_chrome():
-    """Force kill leftover Chrome/Chromedriver processes to prevent session errors."""
-    try:
-        logger.info("Killing leftover Chrome/Chromedriver processes...")
-        subprocess.call(["pkill", "-9", "-f", "chrome"])
-        subprocess.call(["pkill", "-9", "-f", "chromedriver"])
-        time.sleep(2)
-    except Exception as e:
-        logger.warning(f"Failed to kill zombie Chrome processes: {e}")
+# Threads only enqueue records; one listener thread does the file and console I/O
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)  # flush what is still queued
+queue_handler = QueueHandler(log_queue)
+logger.addHandler(queue_handler)
+
+# Product pages are scraped by this many browsers at once (threads sharing the driver pool)
+BROWSER_WORKERS = int(os.environ.get("BOAT_BROWSER_WORKERS", 4))
+
+# ========== Output Tables ==========
+CSV_FIELDS = {
+    "products": ["brand", "category_id", "product_id", "title", "price", "main_price", "discount", "rating", "link"],
+    "features": ["product_id", "feature"],
+    "specifications": ["product_id", "key", "value"],
+    "reviews": ["product_id", "author", "rating", "title", "body"],
+    "faqs": ["product_id", "question", "answer"],
+}
+
+# ========== In-page Extraction ==========
+# Unique hrefs of the anchors matching arguments[0], in page order, in one round trip
+HREFS_JS = """
+return Array.from(new Set(Array.from(document.querySelectorAll(arguments[0]), a => a.href).filter(Boolean)));
+"""
+
+# Reads every product field in one WebDriver round trip instead of one per element.
+# specs is null when a .specs-item lacks its key or value, so the caller falls back
+# to the specifications table; reviews missing a field come back as null.
+PRODUCT_FIELDS_JS = """
+const text = sel => {
+    const el = document.querySelector(sel);
+    return el ? el.innerText.trim() : null;
+};
+const stars = document.querySelector('.rating__stars');
+let specs = Array.from(document.getElementsByClassName('specs-item'), item => {
+    const key = item.getElementsByClassName('spec-type')[0], value = item.getElementsByClassName('spec')[0];
+    return key && value ? [key.innerText.trim(), value.innerText.trim()] : null;
+});
+if (specs.includes(null)) specs = null;
+return {
+    title: text('h1'),
+    price: text('span.price--highlight.price--large'),
+    main_price: text('span.price--compare.line-through'),
+    discount: text('p.custom-saved-price'),
+    rating: stars ? stars.getAttribute('data-rating') : null,
+    features: text('.pdp-title-extra-info small') || '',
+    specs: specs,
+    reviews: Array.from(document.getElementsByClassName('jdgm-rev'), rev => {
+        const q = cls => rev.getElementsByClassName(cls)[0];
+        const author = q('jdgm-rev__author'), rating = q('jdgm-rev__rating'),
+              title = q('jdgm-rev__title'), body = q('jdgm-rev__body');
+        if (!(author && rating && title && body)) return null;
+        return {
+            author: author.innerText.trim(),
+            rating: rating.querySelectorAll('.jdgm-star.jdgm--on').length,
+            title: title.innerText.trim(),
+            body: body.innerText.trim(),
+        };
+    }),
+};
+"""
 
 # ========== WebDriver Setup ==========
-def setup_driver():
-    kill_zombie_chrome()
-
+def setup_driver(performance_log=False):
+    """
+    Start a headless Chrome. `performance_log` enables the CDP performance log
+    that scroll_to_load_all reads networkIdle from; only category pages need it,
+    since the log buffers every Network event until drained.
+    """
     options = Options()
     options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-notifications")
     options.add_argument("--window-size=1920,1080")
+    options.add_experimental_option("prefs", CHROME_PREFS)
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    # Fresh profile per browser, but the HTTP cache persists across runs
+    cache_dir, cache_lock = claim_cache_dir("boat")
+    if cache_dir:
+        for arg in cache_args(cache_dir):
+            options.add_argument(arg)
+    if performance_log:
+        # Page.lifecycleEvent notifications are read back from the performance log
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
     driver = None
-    system_platform = platform.system().lower()
 
     try:
-        if system_platform == 'linux':
-            chrome_path = "/usr/bin/google-chrome"
-            chromedriver_path = "/root/new_dataextraction/linux_browser/chromedriver/chromedriver"
-
-            if not os.path.exists(chrome_path) or not os.path.exists(chromedriver_path):
-                raise FileNotFoundError("Chrome or Chromedriver not found at expected paths.")
+        if IS_LINUX:
+            chrome_path, chromedriver_path = CHROME_BIN, CHROMEDRIVER_BIN
 
-            os.chmod(chrome_path, 0o755)
-            os.chmod(chromedriver_path, 0o755)
+            ensure_executable(chrome_path, chromedriver_path,
+                               missing_msg="Chrome or Chromedriver not found at expected paths.")
 
             options.binary_location = chrome_path
 
@@ -78,225 +152,297 @@ def setup_driver():
             temp_profile = tempfile.mkdtemp()
             options.add_argument(f"--user-data-dir={temp_profile}")
 
-            service = Service(executable_path=chromedriver_path)
+            # Own session, so kill_driver() can take down exactly this chromedriver and its Chrome
+            service = Service(executable_path=chromedriver_path, popen_kw={"start_new_session": True})
             driver = webdriver.Chrome(service=service, options=options)
             driver.temp_profile_dir = temp_profile
 
         else:
-            service = Service(ChromeDriverManager().install())
+            service = Service(managed_driver_path())
             driver = webdriver.Chrome(service=service, options=options)
 
+        driver.cache_lock = cache_lock
+        block_heavy_resources(driver)
         logger.info("WebDriver initialized")
         return driver
 
     except Exception as e:
         logger.exception("WebDriver initialization failed")
+        if cache_lock:
+            cache_lock.close()
         raise
 
+def kill_driver(driver):
+    """SIGKILL the chromedriver we spawned together with the Chrome processes in its session."""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None:
+        return
+    try:
+        if hasattr(os, "killpg") and os.getpgid(process.pid) == process.pid:
+            os.killpg(process.pid, signal.SIGKILL)  # own session: its Chrome children go too
+        else:
+            process.kill()
+        logger.info("Killed chromedriver session %s", process.pid)
+    except OSError as e:
+        logger.warning("Failed to kill chromedriver session %s: %s", process.pid, e)
+
+def close_driver(driver):
+    """Quit the browser and remove its temporary profile directory."""
+    try:
+        driver.quit()
+        logger.info("Browser closed.")
+    except Exception as e:
+        logger.warning("Error closing WebDriver: %s", e)
+        kill_driver(driver)
+    if getattr(driver, "cache_lock", None):
+        driver.cache_lock.close()  # frees the disk cache slot for the next browser
+
+    if hasattr(driver, "temp_profile_dir"):
+        shutil.rmtree(driver.temp_profile_dir, ignore_errors=True)
+        logger.info("Temporary Chrome profile directory cleaned up.")
+
+@contextmanager
+def chrome_session(performance_log=False):
+    """One Chrome for a block of work; quit (or killed) and its temp profile removed on exit."""
+    driver = setup_driver(performance_log)
+    try:
+        yield driver
+    finally:
+        close_driver(driver)
+
+# Warm drivers reused across scrape() calls in this process
+_DRIVER_POOL = DriverPool(setup_driver, close_driver, size=BROWSER_WORKERS)
+acquire_driver = _DRIVER_POOL.acquire
+# Category pages get their own warm driver, the only one with the performance log on
+_CATEGORY_POOL = DriverPool(functools.partial(setup_driver, performance_log=True), close_driver)
+
 # ========== Scraper Utilities ==========
-def scroll_to_load_all(driver, scroll_times=50, pause=3):
+def _enable_lifecycle_events(driver):
+    """Turn on CDP page lifecycle events before a navigation; False if this driver can't report them."""
+    try:
+        driver.execute_cdp_cmd("Page.enable", {})
+        driver.execute_cdp_cmd("Page.setLifecycleEventsEnabled", {"enabled": True})
+        driver.get_log("performance")  # drop events from earlier navigations
+        return True
+    except WebDriverException:
+        return False
+
+def _wait_network_idle(driver, timeout, poll=0.1):
+    """Drain the performance log until Chrome reports networkIdle or `timeout` passes."""
+    deadline = time.monotonic() + timeout
+    while True:
+        for entry in driver.get_log("performance"):
+            if '"networkIdle"' not in entry["message"]:
+                continue
+            message = json.loads(entry["message"])["message"]
+            if message["method"] == "Page.lifecycleEvent" and message["params"]["name"] == "networkIdle":
+                return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll)
+
+def scroll_to_load_all(driver, scroll_times=50, timeout=5, stable_checks=2, lifecycle=False, step_timeout=0.5):
+    """
+    Scroll down a tenth of the page height at a time until, at the bottom, the
+    height stops growing for `stable_checks` rounds.
+
+    Stepping passes every lazy-load trigger on the way down instead of jumping
+    over them. After each step the page has up to `step_timeout` seconds to grow,
+    or `timeout` at the bottom. With `lifecycle`, the initial render is first
+    allowed to settle on CDP's networkIdle; Chrome reports that once per
+    navigation, not after scroll-triggered requests.
+    """
     try:
-        height = driver.execute_script('return document.body.scrollHeight')
-        scroll_height = 0
+        if lifecycle:
+            _wait_network_idle(driver, timeout)
+        step = driver.execute_script('return document.body.scrollHeight') / 10
+        position, stable = 0, 0
         for _ in range(scroll_times):
-            scroll_height += height / 10
-            driver.execute_script('window.scrollTo(0, arguments[0]);', scroll_height)
-            time.sleep(pause)
+            # Scroll one step and read where it landed and the height in one call
+            position, height, at_bottom = driver.execute_script(
+                'window.scrollTo(0, arguments[0]); const h = document.body.scrollHeight;'
+                ' return [window.scrollY, h, window.scrollY + window.innerHeight >= h - 1];',
+                position + step)
+            try:
+                WebDriverWait(driver, timeout if at_bottom else step_timeout).until(
+                    lambda d: d.execute_script('return document.body.scrollHeight') != height)
+                stable = 0
+            except TimeoutException:
+                if at_bottom:
+                    stable += 1
+                    if stable >= stable_checks:
+                        break
         logger.info("Scrolling completed.")
     except Exception as e:
         logger.exception("Error while scrolling the page.")
 
 def collect_product_links(driver, category_url):
     try:
+        lifecycle = _enable_lifecycle_events(driver)
         driver.get(category_url)
-        scroll_to_load_all(driver)
-        product_elements = driver.find_elements(By.CSS_SELECTOR, "a.product-item-meta__title")
-        links = [el.get_attribute("href") for el in product_elements if el.get_attribute("href")]
-        logger.info(f"{len(links)} product links collected.")
+        scroll_to_load_all(driver, lifecycle=lifecycle)
+        links = driver.execute_script(HREFS_JS, "a.product-item-meta__title")
+        logger.info("%s product links collected.", len(links))
         return links
     except Exception as e:
         logger.exception("Failed to collect product links.")
         return []
 
-def extract_specifications(driver):
+def extract_specifications_table(driver):
+    """Specifications from the tabbed table, for pages without usable .specs-item blocks."""
     specs = {}
     try:
-        spec_items = driver.find_elements(By.CLASS_NAME, "specs-item")
-        for spec in spec_items:
-            key = spec.find_element(By.CLASS_NAME, "spec-type").text.strip()
-            value = spec.find_element(By.CLASS_NAME, "spec").text.strip()
-            specs[key] = value
-    except:
-        try:
-            spec_button = WebDriverWait(driver, 3).until(
-                EC.presence_of_element_located((By.ID, "btn-specifications"))
-            )
-            driver.execute_script("arguments[0].click();", spec_button)
-            time.sleep(2)
-            rows = driver.find_element(By.ID, "specifications").find_elements(By.TAG_NAME, "tr")
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 2:
-                    specs[cells[0].text.strip()] = cells[1].text.strip()
-        except Exception:
-            logger.debug("Specifications not found or clickable.")
-    return specs
-
-def extract_reviews(driver):
-    reviews = []
-    try:
-        review_blocks = driver.find_elements(By.CLASS_NAME, "jdgm-rev")
-        for block in review_blocks:
-            try:
-                reviews.append({
-                    "author": block.find_element(By.CLASS_NAME, "jdgm-rev__author").text.strip(),
-                    "rating": len(block.find_element(By.CLASS_NAME, "jdgm-rev__rating").find_elements(By.CLASS_NAME, "jdgm-star.jdgm--on")),
-                    "title": block.find_element(By.CLASS_NAME, "jdgm-rev__title").text.strip(),
-                    "body": block.find_element(By.CLASS_NAME, "jdgm-rev__body").text.strip()
-                })
-            except:
-                continue
+        spec_button = WebDriverWait(driver, 3).until(
+            EC.presence_of_element_located((By.ID, "btn-specifications"))
+        )
+        driver.execute_script("arguments[0].click();", spec_button)
+        time.sleep(2)
+        rows = driver.find_element(By.ID, "specifications").find_elements(By.TAG_NAME, "tr")
+        for row in rows:
+            cells = row.find_elements(By.TAG_NAME, "td")
+            if len(cells) >= 2:
+                specs[cells[0].text.strip()] = cells[1].text.strip()
     except Exception:
-        logger.debug("No reviews found.")
-    return reviews
+        logger.debug("Specifications not found or clickable.")
+    return specs
 
 def extract_faqs(driver):
     faqs = []
     try:
         faq_blocks = driver.find_elements(By.CLASS_NAME, "ac-tab-new")
         for block in faq_blocks:
+            question = first_element(block, By.CLASS_NAME, "product-ques")
+            answer = first_element(block, By.CLASS_NAME, "product-ans")
+            if question is None or answer is None:
+                continue
             try:
-                try:
-                    plus_icon = block.find_element(By.CLASS_NAME, "plus_icon")
-                    driver.execute_script("arguments[0].click();", plus_icon)
-                except:
-                    question_elem = block.find_element(By.CLASS_NAME, "product-ques")
-                    driver.execute_script("arguments[0].click();", question_elem)
+                toggle = first_element(block, By.CLASS_NAME, "plus_icon") or question
+                driver.execute_script("arguments[0].click();", toggle)
                 time.sleep(0.5)
-                faqs.append({
-                    "question": block.find_element(By.CLASS_NAME, "product-ques").text.strip(),
-                    "answer": block.find_element(By.CLASS_NAME, "product-ans").text.strip()
-                })
+                faqs.append({"question": question.text.strip(), "answer": answer.text.strip()})
             except Exception:
                 continue
     except Exception:
         logger.debug("FAQ extraction failed.")
     return faqs
 
-def extract_product_details(driver, wait, links, brand, category_id):
-    products, features, specifications, reviews, faqs = [], [], [], [], []
-
-    for i, link in enumerate(links):
-        try:
-            driver.get(link)
-            driver.refresh()
-            time.sleep(2)
-            product_id = f"{category_id}_product_{i + 1}"
-
-            # ---- Title Extraction ----
-            # try:
-            #     title_element = WebDriverWait(driver, 20).until(
-            #         EC.visibility_of_element_located((By.TAG_NAME, "h1"))
-            #     )
-            #     title = title_element.text.strip()
-            # except Exception as e:
-            #     logger.warning(f"Title not found at {link} - {e}")
-            #     title = "title not found"
-            # --------------------------
-
-            
-            title = driver.find_element(By.CSS_SELECTOR, "h1").text.strip()    
-            sale_price = driver.find_element(By.CSS_SELECTOR, "span.price--highlight.price--large").get_attribute("innerText").strip()
-            main_price = driver.find_element(By.CSS_SELECTOR, "span.price--compare.line-through").get_attribute("innerText").strip()
-            discount = driver.find_element(By.CSS_SELECTOR, "p.custom-saved-price").text.strip()
-            rating = driver.find_element(By.CLASS_NAME, "rating__stars").get_attribute("data-rating").strip() if driver.find_elements(By.CLASS_NAME, "rating__stars") else "Rating not found"
-            features_text = driver.execute_script("return document.querySelector('.pdp-title-extra-info small')?.innerText || ''")
-            feature_list = [f.strip() for f in features_text.split(",") if f.strip()]
-
-            specs = extract_specifications(driver)
-            revs = extract_reviews(driver)
-            faq_list = extract_faqs(driver)
-
-            products.append({
-                "product_id": product_id, "title": title, "price": sale_price,
-                "main_price": main_price, "discount": discount, "rating": rating,
-                "link": link, "brand": brand, "category_id": category_id
-            })
-
-            features.extend({"product_id": product_id, "feature": f} for f in feature_list)
-            specifications.extend({"product_id": product_id, "key": k, "value": v} for k, v in specs.items())
-            reviews.extend({"product_id": product_id, **r} for r in revs)
-            faqs.extend({"product_id": product_id, **f} for f in faq_list)
-
-        except Exception as e:
-            logger.error(f"Failed to extract product at {link} - {e}")
-            continue
-
-    return products, features, specifications, reviews, faqs
-
-def save_to_csv(products, features, specifications, reviews, faqs, output_dir, prefix):
+def _scrape_one(driver, i, link, brand, category_id):
+    """Scrape one product page into (product, features, specifications, reviews, faqs) rows, or None."""
     try:
-        def save(data, filename, fieldnames):
-            with open(os.path.join(output_dir, filename), "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
-
-        save(products, f"{prefix}_products.csv", ["brand", "category_id", "product_id", "title", "price", "main_price", "discount", "rating", "link"])
-        save(features, f"{prefix}_features.csv", ["product_id", "feature"])
-        save(specifications, f"{prefix}_specifications.csv", ["product_id", "key", "value"])
-        save(reviews, f"{prefix}_reviews.csv", ["product_id", "author", "rating", "title", "body"])
-        save(faqs, f"{prefix}_faqs.csv", ["product_id", "question", "answer"])
-        logger.info("All CSV files saved successfully.")
+        driver.get(link)
+        driver.refresh()
+        time.sleep(2)
+        product_id = f"{category_id}_product_{i + 1}"
+
+        fields = driver.execute_script(PRODUCT_FIELDS_JS)
+        missing = [k for k in ("title", "price", "main_price", "discount") if fields[k] is None]
+        if missing:
+            raise NoSuchElementException(f"Missing {', '.join(missing)}")
+
+        rating = fields["rating"].strip() if fields["rating"] is not None else "Rating not found"
+        feature_list = [f.strip() for f in fields["features"].split(",") if f.strip()]
+
+        specs = dict(fields["specs"]) if fields["specs"] is not None else extract_specifications_table(driver)
+        revs = [r for r in fields["reviews"] if r]
+        faq_list = extract_faqs(driver)
+
+        product = {
+            "product_id": product_id, "title": fields["title"], "price": fields["price"],
+            "main_price": fields["main_price"], "discount": fields["discount"], "rating": rating,
+            "link": link, "brand": brand, "category_id": category_id
+        }
+        return (
+            product,
+            [{"product_id": product_id, "feature": f} for f in feature_list],
+            [{"product_id": product_id, "key": k, "value": v} for k, v in specs.items()],
+            [{"product_id": product_id, **r} for r in revs],
+            [{"product_id": product_id, **f} for f in faq_list],
+        )
+
     except Exception as e:
-        logger.exception("Error saving CSV files.")
+        logger.error("Failed to extract product at %s - %s", link, e)
+        return None
+
+def _scrape_pooled(args):
+    with acquire_driver() as driver:
+        return _scrape_one(driver, *args)
+
+def extract_product_details(links, brand, category_id, tables=None, workers=BROWSER_WORKERS):
+    """
+    Scrape product pages on `workers` pooled browsers, handing each product's rows to
+    `tables` (table name -> list or sink) in link order as soon as they are ready.
+    """
+    if tables is None:
+        tables = {name: [] for name in CSV_FIELDS}
+    if not links:
+        return tables
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(links)))) as ex:
+        results = ex.map(_scrape_pooled, [(i, link, brand, category_id) for i, link in enumerate(links)])
+        for result in results:
+            if result is None:
+                continue
+            product, product_features, product_specs, product_reviews, product_faqs = result
+            tables["products"].append(product)
+            tables["features"].extend(product_features)
+            tables["specifications"].extend(product_specs)
+            tables["reviews"].extend(product_reviews)
+            tables["faqs"].extend(product_faqs)
+
+    return tables
+
+# ========== In-process Entry ==========
+def scrape(url, category_id, brand):
+    """Scrape one category and return its tables as DataFrames keyed like the CSV files."""
+    brand = brand.lower()
+    with _CATEGORY_POOL.acquire() as driver:
+        logger.info("Started scraping for brand=%s, category_id=%s, url=%s", brand, category_id, url)
+        product_links = collect_product_links(driver, url)
+        logger.info("Collected %s product links", len(product_links))
+
+    tables = extract_product_details(product_links, brand, category_id)
+    return {name: pd.DataFrame(rows, columns=CSV_FIELDS[name]) for name, rows in tables.items()}
 
 # ========== Main Entry ==========
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
-    parser.add_argument("--url", required=True, help="Category page URL to scrape")
-    parser.add_argument("--category_id", required=True, help="Category ID for tracking")
+    parser.add_argument("--url", required=True, help="Category page URL(s) to scrape, comma-separated")
+    parser.add_argument("--category_id", required=True, help="Category ID(s) for tracking, one per URL")
     parser.add_argument("--brand", required=True, help="Brand name (e.g., boat)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv", help="Output file format")
 
     args = parser.parse_args()
     brand = args.brand.lower()
-    category_id = args.category_id
-    url = args.url
+    urls = [u.strip() for u in args.url.split(",")]
+    category_ids = [c.strip() for c in args.category_id.split(",")]
+    if len(urls) != len(category_ids):
+        parser.error("--url and --category_id need the same number of comma-separated values")
 
     output_dir = os.path.join("data", brand)
-    prefix = f"{brand}_{category_id}"
     os.makedirs(output_dir, exist_ok=True)
 
-    driver = setup_driver()
-    wait = WebDriverWait(driver, 30)
-
     try:
-        logger.info(f"Started scraping for brand={brand}, category_id={category_id}, url={url}")
+        # One browser collects links for every category in this run
+        with chrome_session(performance_log=True) as driver:
+            for url, category_id in zip(urls, category_ids):
+                try:
+                    logger.info("Started scraping for brand=%s, category_id=%s, url=%s", brand, category_id, url)
 
-        logger.info("Collecting product links...")
-        product_links = collect_product_links(driver, url)
-        logger.info(f"Collected {len(product_links)} product links")
+                    logger.info("Collecting product links...")
+                    product_links = collect_product_links(driver, url)
+                    logger.info("Collected %s product links", len(product_links))
 
-        logger.info("Extracting product details...")
-        products, features, specifications, reviews, faqs = extract_product_details(
-            driver, wait, product_links, brand, category_id
-        )
+                    # Rows go straight to disk as each product finishes
+                    logger.info("Extracting product details...")
+                    prefix = f"{brand}_{category_id}"
+                    with ExitStack() as stack:
+                        sinks = {name: stack.enter_context(open_sink(os.path.join(output_dir, f"{prefix}_{name}"), fields, args.format))
+                                 for name, fields in CSV_FIELDS.items()}
+                        extract_product_details(product_links, brand, category_id, sinks)
+                    logger.info("Scraping and data saving completed successfully.")
 
-        logger.info("Saving scraped data to CSV...")
-        save_to_csv(products, features, specifications, reviews, faqs, output_dir, prefix)
-        logger.info("Scraping and data saving completed successfully.")
+                except Exception as e:
+                    logger.exception("Scraping failed for category_id=%s due to an unexpected error.", category_id)
 
     except Exception as e:
         logger.exception("Scraping failed due to an unexpected error.")
-
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                logger.info("Browser closed.")
-            except Exception as e:
-                logger.warning(f"Error closing WebDriver: {e}")
-
-            if hasattr(driver, "temp_profile_dir"):
-                shutil.rmtree(driver.temp_profile_dir, ignore_errors=True)
-                logger.info("Temporary Chrome profile directory cleaned up.")
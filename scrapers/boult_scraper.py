@@ -1,27 +1,48 @@
 import os
-import csv
+import re
+import html
+import functools
 import time
-import platform
 import argparse
+import queue
+import atexit
 import logging
 import tempfile
 import shutil
-import subprocess
+import signal
+import threading
+import pandas as pd
+import requests
+import lxml.etree
+import lxml.html
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-
-# Import only on Windows
-if platform.system().lower() == 'windows':
-    from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+
+try:
+    from scrapers.driver_pool import DriverPool
+    from scrapers.csv_sink import OUTPUT_FORMATS, open_sink
+    from scrapers.browser import (CHROME_PREFS, CHROME_BIN, CHROMEDRIVER_BIN, IS_LINUX, block_heavy_resources,
+                                  ensure_executable, first_element, managed_driver_path)
+    from scrapers.disk_cache import cache_args, claim_cache_dir
+except ImportError:  # run as a script: python scrapers/<brand>_scraper.py
+    from driver_pool import DriverPool
+    from csv_sink import OUTPUT_FORMATS, open_sink
+    from browser import (CHROME_PREFS, CHROME_BIN, CHROMEDRIVER_BIN, IS_LINUX, block_heavy_resources,
+                         ensure_executable, first_element, managed_driver_path)
+    from disk_cache import cache_args, claim_cache_dir
 
 # ========== Logging Setup ==========
 logger = logging.getLogger("boult_scraper")
-logger.setLevel(logging.DEBUG)
+# DEBUG records are only built when SCRAPER_LOG_LEVEL=DEBUG
+logger.setLevel(os.environ.get("SCRAPER_LOG_LEVEL", "INFO").upper())
 
 formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
@@ -29,50 +50,116 @@ os.makedirs("logs", exist_ok=True)
 file_handler = logging.FileHandler("logs/boult_scraper.log")
 file_handler.setLevel(logging.DEBUG)
 file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
 
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
 console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
 
-# ========== Zombie Chrome Killer ==========
-def kill_zombie_chrome():
-    """Force kill leftover Chrome/Chromedriver processes to prevent session errors."""
-    if platform.system().lower() == 'linux':
-        try:
-            logger.info("Killing leftover Chrome/Chromedriver processes...")
-            subprocess.call(["pkill", "-9", "-f", "chrome"])
-            subprocess.call(["pkill", "-9", "-f", "chromedriver"])
-            time.sleep(2)  # Let the system settle
-        except Exception as e:
-            logger.warning(f"Failed to kill zombie Chrome processes: {e}")
+# Threads only enqueue records; one listener thread does the file and console I/O
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)  # flush what is still queued
+queue_handler = QueueHandler(log_queue)
+logger.addHandler(queue_handler)
+
+# Default number of browsers running at once; scrape(workers=...) and --max-concurrency override it
+BROWSER_WORKERS = int(os.environ.get("BOULT_BROWSER_WORKERS", 5))
+
+# Product pages are first fetched over plain HTTP, this many at a time
+HTTP_WORKERS = int(os.environ.get("BOULT_HTTP_WORKERS", 10))
+
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept-Language": "en-IN,en;q=0.9",
+}
+_thread_local = threading.local()
+
+
+def http_session():
+    """This thread's keep-alive session; requests.Session is not safe to share between the fetch threads."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+        session.headers.update(HTTP_HEADERS)
+    return session
+
+# ========== Output Tables ==========
+CSV_FIELDS = {
+    "products": ["brand", "category_id", "product_id", "title", "price", "main_price", "discount", "link"],
+    "features": ["product_id", "feature"],
+    "specifications": ["product_id", "key", "value"],
+    "reviews": ["product_id", "author", "rating", "title", "body"],
+    "faqs": ["product_id", "question", "answer"],
+}
+
+# Element locators and wait conditions, built once instead of per call
+H1_PRESENT = EC.presence_of_element_located((By.TAG_NAME, "h1"))
+REVIEW_PRESENT = EC.presence_of_element_located((By.CLASS_NAME, "jdgm-rev"))
+FAQ_BLOCK_LOC = (By.CLASS_NAME, "product-faq")
+FAQ_TITLE_LOC = (By.CLASS_NAME, "faq-title")
+FAQ_ANSWER_LOC = (By.CSS_SELECTOR, "div.faq-answer p")
+# Seconds an opened FAQ accordion gets to show its answer
+FAQ_ANSWER_WAIT = 1.5
+
+# Unique product links from the search grid (first anchor of each tile), in page order
+PRODUCT_LINKS_JS = """
+const tiles = document.querySelectorAll('.wizzy-search-results ul.wizzy-search-results-list li');
+return Array.from(new Set(Array.from(tiles, li => li.querySelector('a')?.href).filter(Boolean)));
+"""
+
+# Every product field in one CDP Runtime.evaluate; missing text fields come back as "N/A".
+# Sections are {heading, points}; reviews missing a field come back as null.
+PRODUCT_FIELDS_JS = """
+const text = sel => document.querySelector(sel)?.innerText.trim() ?? 'N/A';
+return {
+    title: document.querySelector('h1.proTitle')?.innerText || document.querySelector('h1').innerText.trim(),
+    price: text('#priceChange'),
+    main_price: text('span.comPrice'),
+    discount: text('span.total-discount'),
+    sections: Array.from(document.querySelectorAll('div.WI_productDrop_con'), s => ({
+        heading: s.querySelector('p.WI_productDrop_heading')?.innerText ?? null,
+        points: Array.from(s.querySelectorAll('ul.WI_productDrop_info li p'),
+                           p => p.innerText.trim() || p.innerHTML.trim()),
+    })),
+    reviews: Array.from(document.getElementsByClassName('jdgm-rev'), rev => {
+        const q = cls => rev.getElementsByClassName(cls)[0];
+        const author = q('jdgm-rev__author'), rating = q('jdgm-rev__rating'),
+              title = q('jdgm-rev__title'), body = q('jdgm-rev__body');
+        if (!(author && rating && title && body)) return null;
+        return {
+            author: author.innerText.trim(),
+            rating: rating.querySelectorAll('.jdgm-star.jdgm--on').length,
+            title: title.innerText.trim(),
+            body: body.innerText.trim(),
+        };
+    }),
+};
+"""
 
 # --- Setup WebDriver ---
 def setup_driver():
-
-    kill_zombie_chrome()
-
     options = Options()
     options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--disable-notifications")
     options.add_argument("--window-size=1920,1080")
+    options.add_experimental_option("prefs", CHROME_PREFS)
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    # Fresh profile per browser, but the HTTP cache persists across runs
+    cache_dir, cache_lock = claim_cache_dir("boult")
+    if cache_dir:
+        for arg in cache_args(cache_dir):
+            options.add_argument(arg)
 
-    system_platform = platform.system().lower()
     driver = None
 
     try:
-        if system_platform == 'linux':
-            chrome_path = "/usr/bin/google-chrome"
-            chromedriver_path = "/root/new_dataextraction/linux_browser/chromedriver/chromedriver"
-
-            if not os.path.exists(chrome_path) or not os.path.exists(chromedriver_path):
-                raise FileNotFoundError("Chrome or Chromedriver not found")
+        if IS_LINUX:
+            chrome_path, chromedriver_path = CHROME_BIN, CHROMEDRIVER_BIN
 
-            os.chmod(chrome_path, 0o755)
-            os.chmod(chromedriver_path, 0o755)
+            ensure_executable(chrome_path, chromedriver_path, missing_msg="Chrome or Chromedriver not found")
 
             options.binary_location = chrome_path
 
@@ -80,171 +167,373 @@ def setup_driver():
             temp_profile = tempfile.mkdtemp()
             options.add_argument(f"--user-data-dir={temp_profile}")
 
-            service = Service(executable_path=chromedriver_path)
+            # Own session, so kill_driver() can take down exactly this chromedriver and its Chrome
+            service = Service(executable_path=chromedriver_path, popen_kw={"start_new_session": True})
             driver = webdriver.Chrome(service=service, options=options)
             driver.temp_profile_dir = temp_profile
 
         else:
-            from webdriver_manager.chrome import ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
+            service = Service(managed_driver_path())
             driver = webdriver.Chrome(service=service, options=options)
 
+        driver.cache_lock = cache_lock
+        block_heavy_resources(driver)
         logger.info("WebDriver initialized")
         return driver
 
     except Exception as e:
         logger.exception("WebDriver initialization failed")
+        if cache_lock:
+            cache_lock.close()
         raise
 
+
+def kill_driver(driver):
+    """SIGKILL the chromedriver we spawned together with the Chrome processes in its session."""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None:
+        return
+    try:
+        if hasattr(os, "killpg") and os.getpgid(process.pid) == process.pid:
+            os.killpg(process.pid, signal.SIGKILL)  # own session: its Chrome children go too
+        else:
+            process.kill()
+        logger.info("Killed chromedriver session %s", process.pid)
+    except OSError as e:
+        logger.warning("Failed to kill chromedriver session %s: %s", process.pid, e)
+
+def close_driver(driver):
+    """Quit the browser and remove its temporary profile directory."""
+    try:
+        driver.quit()
+        logger.info("Browser closed.")
+    except Exception as e:
+        logger.warning("Error closing browser: %s", e)
+        kill_driver(driver)
+    if getattr(driver, "cache_lock", None):
+        driver.cache_lock.close()  # frees the disk cache slot for the next browser
+
+    if hasattr(driver, "temp_profile_dir"):
+        shutil.rmtree(driver.temp_profile_dir, ignore_errors=True)
+        logger.info("Temporary Chrome profile directory cleaned up.")
+
+@functools.lru_cache(maxsize=None)
+def driver_pool(size=BROWSER_WORKERS):
+    """Pool of up to `size` warm drivers, shared by every scrape() in this process asking for that size."""
+    return DriverPool(setup_driver, close_driver, size=max(1, size))
+
 # -------------------
 # SCRAPER FUNCTIONS
 # -------------------
 def get_product_links(driver, category_url, scrolls=30):
-    product_links = set()
     driver.get(category_url)
     last_height = driver.execute_script("return document.body.scrollHeight")
 
     for _ in range(scrolls):
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
+        try:
+            # Continue as soon as the next batch grows the page; stop once it doesn't
+            WebDriverWait(driver, 5).until(
+                lambda d: d.execute_script("return document.body.scrollHeight") > last_height)
+        except TimeoutException:
             break
-        last_height = new_height
+        last_height = driver.execute_script("return document.body.scrollHeight")
 
     try:
-        product_grid = driver.find_element(By.CLASS_NAME, "wizzy-search-results")
-        for ul in product_grid.find_elements(By.CSS_SELECTOR, "ul.wizzy-search-results-list"):
-            for li in ul.find_elements(By.TAG_NAME, "li"):
-                try:
-                    href = li.find_element(By.TAG_NAME, "a").get_attribute("href")
-                    if href:
-                        product_links.add(href)
-                except Exception as e:
-                    logger.warning(f"Error extracting product link: {e}")
+        product_links = driver.execute_script(PRODUCT_LINKS_JS)
     except Exception as e:
-        logger.error(f"Error in product grid: {e}")
-
-    return list(product_links)
+        logger.error("Error in product grid: %s", e)
+        return []
+    if not product_links:
+        logger.error("No product links in the product grid of %s", category_url)
+    return product_links
 
 
-def scrape_product_details(driver, wait, product_links, category_id, brand):
+def _scrape_one(driver, idx, product_id, url, total, base_info):
+    """Scrape one product page into (products, features, specifications, reviews, faqs) rows."""
+    logger.info("Scraping %s/%s: %s", idx, total, url)
+    info = base_info | {"product_id": product_id, "link": url}
     products, features, specifications, reviews, faqs = [], [], [], [], []
 
-    for idx, url in enumerate(product_links, start=1):
-        product_id = f"{category_id}_product_{idx}"
-        logger.info(f"Scraping {idx}/{len(product_links)}: {url}")
-        info = {"product_id": product_id, "link": url, "category_id": category_id, "brand": brand}
+    try:
+        wait = WebDriverWait(driver, 20)
+        driver.get(url)
+        wait.until(H1_PRESENT)
+        load_reviews(driver, wait, product_id)
+
+        fields = evaluate_js(driver, PRODUCT_FIELDS_JS)
+        info.update((k, fields[k]) for k in ("title", "price", "main_price", "discount"))
+        products.append(info)
+        add_sections(fields["sections"], product_id, features, specifications)
+        reviews.extend({"product_id": product_id, **r} for r in fields["reviews"] if r)
+        extract_faqs(driver, product_id, faqs)
 
-        try:
-            driver.get(url)
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
+    except Exception as e:
+        logger.error("Failed to scrape %s: %s", url, e)
+
+    return products, features, specifications, reviews, faqs
 
-            info["title"] = driver.execute_script("return document.querySelector('h1.proTitle')?.innerText") or \
-                             driver.find_element(By.TAG_NAME, "h1").text.strip()
-            info["price"] = get_text_or_default(driver, By.ID, "priceChange")
-            info["main_price"] = get_text_or_default(driver, By.CSS_SELECTOR, "span.comPrice")
-            info["discount"] = get_text_or_default(driver, By.CSS_SELECTOR, "span.total-discount")
 
-            products.append(info)
-            extract_sections(driver, product_id, features, specifications)
-            extract_reviews(driver, wait, product_id, reviews)
-            extract_faqs(driver, product_id, faqs)
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Server-rendered product page, read with lxml instead of a browser
+TITLE_XPATH = f"//h1[{_has_class('proTitle')}]"
+PRICE_XPATH = "//*[@id='priceChange']"
+MAIN_PRICE_XPATH = f"//span[{_has_class('comPrice')}]"
+DISCOUNT_XPATH = f"//span[{_has_class('total-discount')}]"
+SECTION_XPATH = f"//div[{_has_class('WI_productDrop_con')}]"
+SECTION_HEADING_XPATH = f".//p[{_has_class('WI_productDrop_heading')}]"
+SECTION_POINTS_XPATH = f".//ul[{_has_class('WI_productDrop_info')}]//li//p"
+REVIEW_XPATH = f"//*[{_has_class('jdgm-rev')}]"
+FAQ_XPATH = f"//*[{_has_class('product-faq')}]"
+
+
+# Elements innerText starts and ends on a new line, with the number of line breaks it requires
+_BLOCK_BREAKS = {"p": 2, **dict.fromkeys(
+    ("div", "li", "ul", "ol", "dl", "dt", "dd", "h1", "h2", "h3", "h4", "h5", "h6",
+     "section", "article", "header", "footer", "table", "tr", "blockquote", "pre"), 1)}
+_UNRENDERED_TAGS = {"script", "style", "template", "noscript"}
+_WHITESPACE = re.compile(r"[ \t\n\r\f]+")
+
+
+def _inner_text(el):
+    """
+    The element's text as the browser's innerText gives it: whitespace collapsed,
+    <br> and block elements as line breaks. Keeps the static rows equal to the
+    ones PRODUCT_FIELDS_JS reads in a browser.
+    """
+    pieces = []  # collapsed text runs, "\n" for <br>, ints for required line breaks
+
+    def walk(node):
+        tag = node.tag if isinstance(node.tag, str) else None  # comments have no text
+        if tag in _UNRENDERED_TAGS:
+            return
+        if tag == "br":
+            pieces.append("\n")
+            return
+        breaks = _BLOCK_BREAKS.get(tag, 0)
+        pieces.append(breaks)
+        if tag and node.text:
+            pieces.append(_WHITESPACE.sub(" ", node.text))
+        for child in node:
+            walk(child)
+            if child.tail:
+                pieces.append(_WHITESPACE.sub(" ", child.tail))
+        pieces.append(breaks)
+
+    walk(el)
+    text, breaks = "", 0
+    for piece in pieces:
+        if isinstance(piece, int):
+            breaks = max(breaks, piece)
+        elif piece == " " and (breaks or not text):
+            continue  # whitespace between blocks renders nothing
+        else:
+            text += "\n" * breaks if text else ""
+            text, breaks = text + piece, 0
+    return "\n".join(re.sub(" +", " ", line).strip(" ") for line in text.split("\n"))
 
-        except Exception as e:
-            logger.error(f"Failed to scrape {url}: {e}")
 
-    return products, features, specifications, reviews, faqs
+def _inner_html(el):
+    return html.escape(el.text or "", quote=False) + "".join(
+        lxml.html.tostring(child, encoding="unicode") for child in el)
 
 
-def get_text_or_default(driver, by, selector, default="N/A"):
-    try:
-        return driver.find_element(by, selector).text.strip()
-    except:
-        return default
+def _first_text(node, xpath, default="N/A"):
+    found = node.xpath(xpath)
+    return _inner_text(found[0]).strip() if found else default
 
 
-def extract_sections(driver, product_id, features, specifications):
-    for section in driver.find_elements(By.CSS_SELECTOR, "div.WI_productDrop_con"):
-        try:
-            heading = section.find_element(By.CSS_SELECTOR, "p.WI_productDrop_heading").text
-            points = [p.text.strip() or p.get_attribute("innerHTML").strip()
-                      for p in section.find_elements(By.CSS_SELECTOR, "ul.WI_productDrop_info li p")]
+def _scrape_static(idx, product_id, url, total, base_info):
+    """
+    Scrape one product page from its HTML without a browser.
+
+    Returns the same row lists as _scrape_one, or None when the page needs
+    JavaScript (no title, reviews not server-rendered, or FAQ answers missing).
+    """
+    try:
+        response = http_session().get(url, timeout=15)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.warning("Static fetch failed for %s: %s", url, e)
+        return None
+    return _parse_static(response.content, idx, product_id, url, total, base_info)
 
-            if "USP" in heading or "Feature" in heading:
-                features.extend({"product_id": product_id, "feature": pt} for pt in points)
-            elif "Specification" in heading:
-                for i in range(0, len(points), 2):
-                    key, value = points[i], points[i+1] if i + 1 < len(points) else ""
-                    specifications.append({"product_id": product_id, "key": key, "value": value})
-            else:
-                specifications.extend({"product_id": product_id, "key": pt, "value": ""} for pt in points)
 
-        except Exception as e:
-            logger.warning(f"Error parsing section: {e}")
+def _parse_static(content, idx, product_id, url, total, base_info):
+    """Rows for _scrape_static from the page's HTML, reading text the way PRODUCT_FIELDS_JS does."""
+    try:
+        tree = lxml.html.fromstring(content)
+    except (lxml.etree.ParserError, ValueError) as e:  # e.g. an empty 200 body
+        logger.warning("Static parse failed for %s: %s", url, e)
+        return None
+    review_blocks = tree.xpath(REVIEW_XPATH)
+    faq_blocks = tree.xpath(FAQ_XPATH)
+    if not tree.xpath("//h1") or not review_blocks:
+        return None
+    if any(not block.xpath(f".//div[{_has_class('faq-answer')}]//p") for block in faq_blocks):
+        return None
+
+    logger.info("Scraping %s/%s (static): %s", idx, total, url)
+    pro_title = tree.xpath(TITLE_XPATH)
+    info = base_info | {
+        "product_id": product_id, "link": url,
+        # Like the JS: h1.proTitle untrimmed, else the first h1 trimmed
+        "title": (_inner_text(pro_title[0]) if pro_title else "") or _first_text(tree, "//h1"),
+        "price": _first_text(tree, PRICE_XPATH),
+        "main_price": _first_text(tree, MAIN_PRICE_XPATH),
+        "discount": _first_text(tree, DISCOUNT_XPATH),
+    }
+    features, specifications, reviews, faqs = [], [], [], []
+
+    sections = [{"heading": _first_text(section, SECTION_HEADING_XPATH, None),
+                 "points": [_inner_text(p).strip() or _inner_html(p).strip()
+                            for p in section.xpath(SECTION_POINTS_XPATH)]}
+                for section in tree.xpath(SECTION_XPATH)]
+    add_sections(sections, product_id, features, specifications)
+
+    for block in review_blocks:
+        fields = [block.xpath(f".//*[{_has_class(c)}]") for c in
+                  ("jdgm-rev__author", "jdgm-rev__rating", "jdgm-rev__title", "jdgm-rev__body")]
+        if not all(fields):
+            continue
+        author, rating, title, body = (f[0] for f in fields)
+        stars = rating.xpath(f".//*[{_has_class('jdgm-star')} and {_has_class('jdgm--on')}]")
+        reviews.append({"product_id": product_id, "author": _inner_text(author).strip(), "rating": len(stars),
+                        "title": _inner_text(title).strip(), "body": _inner_text(body).strip()})
+
+    for block in faq_blocks:
+        question = _first_text(block, f".//*[{_has_class('faq-title')}]", None)
+        if question is None:
+            continue
+        answer = _first_text(block, f".//div[{_has_class('faq-answer')}]//p")
+        faqs.append({"product_id": product_id, "question": question, "answer": answer})
+
+    return [info], features, specifications, reviews, faqs
+
+
+def _scrape_pooled(pool, args):
+    with pool.acquire() as driver:
+        return _scrape_one(driver, *args)
+
+
+def _scrape_product(pool, task):
+    """Static HTML first; a browser from `pool` only when the page needs JavaScript."""
+    result = _scrape_static(*task)
+    if result is None:
+        logger.info("Product %s needs a browser", task[0])
+        result = _scrape_pooled(pool, task)
+    return result
+
+
+def scrape_product_details(product_links, category_id, brand, tables=None, workers=BROWSER_WORKERS):
+    """
+    Scrape product pages, handing each product's rows to `tables` (table name ->
+    list or sink) in link order as soon as they are ready.
+
+    Pages are fetched over HTTP first (HTTP_WORKERS at a time); only those
+    whose content needs JavaScript go to the pooled browsers. `workers` bounds
+    how many browsers run at once, via driver_pool(workers).
+    """
+    if tables is None:
+        tables = {name: [] for name in CSV_FIELDS}
+    if not product_links:
+        return tables
+
+    total = len(product_links)
+    # Fields shared by every product row are built once and merged into each info dict
+    base_info = {"category_id": category_id, "brand": brand}
+    tasks = [(idx, f"{category_id}_product_{idx}", url, total, base_info)
+             for idx, url in enumerate(product_links, start=1)]
+    pool = driver_pool(workers)
+    # Threads waiting for a browser block on the pool, so this only bounds HTTP fetches
+    with ThreadPoolExecutor(max_workers=max(1, min(max(HTTP_WORKERS, workers), total))) as ex:
+        for p, f, s, r, q in ex.map(functools.partial(_scrape_product, pool), tasks):
+            tables["products"].extend(p)
+            tables["features"].extend(f)
+            tables["specifications"].extend(s)
+            tables["reviews"].extend(r)
+            tables["faqs"].extend(q)
+
+    return tables
+
+
+def evaluate_js(driver, body):
+    """Run a JS function body through CDP Runtime.evaluate and return its JSON result."""
+    response = driver.execute_cdp_cmd("Runtime.evaluate", {
+        "expression": f"(() => {{{body}}})()", "returnByValue": True})
+    if "exceptionDetails" in response:
+        raise WebDriverException(response["exceptionDetails"].get("text", "Runtime.evaluate failed"))
+    return response["result"].get("value")
+
+
+def add_sections(sections, product_id, features, specifications):
+    """Sort {heading, points} dropdown sections into feature and specification rows."""
+    for section in sections:
+        heading, points = section["heading"], section["points"]
+        if heading is None:
+            logger.warning("Section without heading skipped for product %s", product_id)
+            continue
+        if "USP" in heading or "Feature" in heading:
+            features.extend({"product_id": product_id, "feature": pt} for pt in points)
+        elif "Specification" in heading:
+            for i in range(0, len(points), 2):
+                key, value = points[i], points[i+1] if i + 1 < len(points) else ""
+                specifications.append({"product_id": product_id, "key": key, "value": value})
+        else:
+            specifications.extend({"product_id": product_id, "key": pt, "value": ""} for pt in points)
 
 
-def extract_reviews(driver, wait, product_id, reviews):
+def load_reviews(driver, wait, product_id):
+    """Scroll to the review widget so it renders; PRODUCT_FIELDS_JS reads the reviews."""
     try:
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
         time.sleep(2)
-        wait.until(EC.presence_of_element_located((By.CLASS_NAME, "jdgm-rev")))
-
-        for block in driver.find_elements(By.CLASS_NAME, "jdgm-rev"):
-            try:
-                author = block.find_element(By.CLASS_NAME, "jdgm-rev__author").text.strip()
-                rating = len(block.find_element(By.CLASS_NAME, "jdgm-rev__rating")
-                              .find_elements(By.CLASS_NAME, "jdgm-star.jdgm--on"))
-                title = block.find_element(By.CLASS_NAME, "jdgm-rev__title").text.strip()
-                body = block.find_element(By.CLASS_NAME, "jdgm-rev__body").text.strip()
-                reviews.append({"product_id": product_id, "author": author, "rating": rating,
-                                "title": title, "body": body})
-            except:
-                continue
+        wait.until(REVIEW_PRESENT)
 
     except TimeoutException:
-        logger.info(f"No reviews found for product {product_id}")
+        logger.info("No reviews found for product %s", product_id)
 
 
 def extract_faqs(driver, product_id, faqs):
-    for block in driver.find_elements(By.CLASS_NAME, "product-faq"):
+    for block in driver.find_elements(*FAQ_BLOCK_LOC):
         try:
-            q = block.find_element(By.CLASS_NAME, "faq-title")
+            q = first_element(block, *FAQ_TITLE_LOC)
+            if q is None:
+                continue
             question = q.text.strip()
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", q)
-            time.sleep(0.5)
             try:
-                driver.execute_script("arguments[0].click();", q)
-            except:
+                driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", q)
+            except WebDriverException:
                 q.click()
-            time.sleep(1.2)
-            try:
-                answer = block.find_element(By.CSS_SELECTOR, "div.faq-answer p").text.strip()
-            except:
-                answer = "Answer not available."
+            answer = "Answer not available."
+            # No answer markup means nothing to wait for
+            answer_el = first_element(block, *FAQ_ANSWER_LOC)
+            if answer_el is not None:
+                try:
+                    # Read as soon as the accordion has opened this block's answer
+                    WebDriverWait(driver, FAQ_ANSWER_WAIT).until(EC.visibility_of(answer_el))
+                    answer = answer_el.text.strip()
+                except TimeoutException:
+                    pass
 
             faqs.append({"product_id": product_id, "question": question, "answer": answer})
-        except:
-            continue
+        except WebDriverException as e:  # NoSuchElement, Timeout, stale or unclickable FAQ block
+            logger.warning("FAQ skipped for product %s: %s", product_id, e)
 
 
-def save_to_csv(products, features, specifications, reviews, faqs, brand, category_id):
-    prefix = f"{brand.lower()}_{category_id}"
-    output_dir = os.path.join("data", brand.lower())
-    os.makedirs(output_dir, exist_ok=True)
-
-    def save(filename, data, fields):
-        with open(os.path.join(output_dir, filename), "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fields)
-            writer.writeheader()
-            writer.writerows(data)
-
-    save(f"{prefix}_products.csv", products,
-         ["brand", "category_id", "product_id", "title", "price", "main_price", "discount", "link"])
-    save(f"{prefix}_features.csv", features, ["product_id", "feature"])
-    save(f"{prefix}_specifications.csv", specifications, ["product_id", "key", "value"])
-    save(f"{prefix}_reviews.csv", reviews, ["product_id", "author", "rating", "title", "body"])
-    save(f"{prefix}_faqs.csv", faqs, ["product_id", "question", "answer"])
+def scrape(url, category_id, brand, workers=BROWSER_WORKERS):
+    """
+    Scrape one category and return its tables as DataFrames keyed like the CSV files.
+    At most `workers` browsers run at once.
+    """
+    with driver_pool(workers).acquire() as driver:
+        links = get_product_links(driver, url)
+    logger.info("Found %s products.", len(links))
+    # The link-collection driver is back in the pool and serves as one of the workers
+    tables = scrape_product_details(links, category_id, brand, workers=workers)
+    return {name: pd.DataFrame(rows, columns=CSV_FIELDS[name]) for name, rows in tables.items()}
 
 
 if __name__ == "__main__":
@@ -252,33 +541,28 @@ if __name__ == "__main__":
     parser.add_argument("--url", required=True)
     parser.add_argument("--category_id", required=True)
     parser.add_argument("--brand", required=True)
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv", help="Output file format")
+    parser.add_argument("--max-concurrency", type=int, default=BROWSER_WORKERS,
+                        help="Browsers running at once")
     args = parser.parse_args()
 
     logger.info("Starting Boult scraper...")
-    driver = setup_driver()
-    wait = WebDriverWait(driver, 20)
-
     try:
         logger.info("Collecting product links...")
-        links = get_product_links(driver, args.url)
-        logger.info(f"Found {len(links)} products.")
+        with driver_pool(args.max_concurrency).acquire() as driver:
+            links = get_product_links(driver, args.url)
+        logger.info("Found %s products.", len(links))
 
+        # Rows go straight to disk as each product finishes
         logger.info("Scraping product details...")
-        products, features, specs, reviews, faqs = scrape_product_details(driver, wait, links, args.category_id, args.brand)
-
-        logger.info("Saving data to CSV...")
-        save_to_csv(products, features, specs, reviews, faqs, args.brand, args.category_id)
+        output_dir = os.path.join("data", args.brand.lower())
+        os.makedirs(output_dir, exist_ok=True)
+        prefix = f"{args.brand.lower()}_{args.category_id}"
+        with ExitStack() as stack:
+            sinks = {name: stack.enter_context(open_sink(os.path.join(output_dir, f"{prefix}_{name}"), fields, args.format))
+                     for name, fields in CSV_FIELDS.items()}
+            scrape_product_details(links, args.category_id, args.brand, sinks, workers=args.max_concurrency)
+        logger.info("Data saved to CSV.")
 
     except Exception as e:
         logger.exception("Script failed")
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                logger.info("Browser closed.")
-            except Exception as e:
-                logger.warning(f"Error closing browser: {e}")
-
-            if hasattr(driver, "temp_profile_dir"):
-                shutil.rmtree(driver.temp_profile_dir, ignore_errors=True)
-                logger.info("Temporary Chrome profile directory cleaned up.")
@@ -0,0 +1,67 @@
+import os
+import logging
+import platform
+import functools
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger("browser")
+
+# Images, video, web fonts and trackers the scraper never reads; blocked to cut page weight
+BLOCKED_URLS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.avif", "*.svg", "*.mp4", "*.webm",
+    "*.woff", "*.woff2", "*.ttf", "*googletagmanager*", "*google-analytics*", "*facebook*",
+]
+# Browser-wide image blocking; covers tabs the CDP block list is not applied to
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+}
+
+
+def block_heavy_resources(driver):
+    """Stop Chrome fetching BLOCKED_URLS for every page this driver loads."""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    except WebDriverException as e:
+        logger.warning("Could not block heavy resources: %s", e)
+
+
+# Resolved once at import instead of per browser start
+IS_LINUX = platform.system().lower() == 'linux'
+CHROME_BIN = "/usr/bin/google-chrome"
+CHROMEDRIVER_BIN = "/root/new_dataextraction/linux_browser/chromedriver/chromedriver"
+
+
+@functools.lru_cache(maxsize=1)
+def managed_driver_path():
+    """chromedriver located (or downloaded) by webdriver_manager, once per process."""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+# The browser binaries only need their mode fixed once per process
+_chmod_done = False
+_chmod_lock = threading.Lock()
+
+
+def ensure_executable(*paths, missing_msg):
+    """chmod 755 `paths` on the first call; FileNotFoundError(missing_msg) if one is absent."""
+    global _chmod_done
+    with _chmod_lock:
+        if _chmod_done:
+            return
+        try:
+            for path in paths:
+                os.chmod(path, 0o755)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"{missing_msg} ({e.filename})") from e
+        _chmod_done = True
+
+
+def first_element(parent, by, selector):
+    """First match under `parent`, or None; find_elements never raises or waits on a miss."""
+    found = parent.find_elements(by, selector)
+    return found[0] if found else None
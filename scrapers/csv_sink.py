@@ -0,0 +1,89 @@
+import csv
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    from pyarrow import parquet as pq
+except ImportError:  # csv.writer sinks only
+    pa = pacsv = pq = None
+
+OUTPUT_FORMATS = ("csv", "parquet")
+
+
+class CsvSink:
+    """
+    Stream the rows of one output table to a CSV file as they are scraped.
+
+    Offers the list methods the scrapers already use (append/extend), so
+    extraction code can fill either a list or a sink. Rows are dicts keyed
+    by `fields`; missing keys are written as empty cells.
+    """
+
+    def __init__(self, path, fields):
+        self.fields = list(fields)
+        self._file = open(path, "w", newline="", encoding="utf-8", buffering=1 << 20)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.fields)
+
+    def append(self, row):
+        self._writer.writerow([row.get(k, "") for k in self.fields])
+
+    def extend(self, rows):
+        self._writer.writerows([row.get(k, "") for k in self.fields] for row in rows)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ArrowSink(CsvSink):
+    """
+    CsvSink that batches rows into PyArrow tables and writes them with
+    Arrow's C++ CSV or Parquet (zstd) writer. Every column is a string.
+    """
+
+    def __init__(self, path, fields, format="csv", batch_rows=1024):
+        self.fields = list(fields)
+        self._schema = pa.schema([(k, pa.string()) for k in self.fields])
+        self._rows = []
+        self._batch_rows = batch_rows
+        if format == "parquet":
+            self._writer = pq.ParquetWriter(str(path), self._schema, compression="zstd")
+        else:
+            self._writer = pacsv.CSVWriter(str(path), self._schema)
+
+    def append(self, row):
+        self._rows.append(row)
+        if len(self._rows) >= self._batch_rows:
+            self.flush()
+
+    def extend(self, rows):
+        self._rows.extend(rows)
+        if len(self._rows) >= self._batch_rows:
+            self.flush()
+
+    def flush(self):
+        if not self._rows:
+            return
+        columns = {k: [None if (v := row.get(k)) is None else str(v) for row in self._rows] for k in self.fields}
+        self._writer.write_table(pa.table(columns, schema=self._schema))
+        self._rows.clear()
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+
+
+def open_sink(path_stem, fields, format="csv"):
+    """Open the sink for `path_stem`.<format>; Parquet needs pyarrow, CSV falls back to csv.writer."""
+    path = f"{path_stem}.{format}"
+    if pa is not None:
+        return ArrowSink(path, fields, format)
+    if format == "parquet":
+        raise ImportError("pyarrow is required for --format parquet")
+    return CsvSink(path, fields)
@@ -0,0 +1,42 @@
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # no flock (Windows): browsers keep Chrome's per-profile cache
+    fcntl = None
+
+# HTTP cache kept across runs so shared theme JS/CSS is not downloaded again
+DISK_CACHE_ROOT = os.environ.get("SCRAPER_DISK_CACHE", os.path.join(tempfile.gettempdir(), "scraper_disk_cache"))
+DISK_CACHE_SIZE = 512 * 1024 * 1024
+
+
+def claim_cache_dir(name, max_slots=32):
+    """
+    Reserve a persistent Chrome disk cache directory under DISK_CACHE_ROOT/name.
+
+    Chrome cannot share one cache directory between running browsers, so
+    each browser takes a numbered slot guarded by an flock. Returns
+    (path, lock); closing the lock file frees the slot. Returns (None, None)
+    when no slot is free or locking is unavailable.
+    """
+    if fcntl is None:
+        return None, None
+    root = os.path.join(DISK_CACHE_ROOT, name)
+    os.makedirs(root, exist_ok=True)
+    for slot in range(max_slots):
+        path = os.path.join(root, str(slot))
+        lock = open(f"{path}.lock", "w")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            continue
+        os.makedirs(path, exist_ok=True)
+        return path, lock
+    return None, None
+
+
+def cache_args(cache_dir):
+    """Chrome flags pointing its HTTP cache at `cache_dir`, capped at DISK_CACHE_SIZE."""
+    return [f"--disk-cache-dir={cache_dir}", f"--disk-cache-size={DISK_CACHE_SIZE}"]
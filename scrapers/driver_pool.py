@@ -0,0 +1,70 @@
+import atexit
+import queue
+import logging
+import threading
+from multiprocessing import util as mp_util
+from contextlib import contextmanager
+
+logger = logging.getLogger("driver_pool")
+
+
+class DriverPool:
+    """
+    Keep up to `size` warm WebDrivers per process so repeated scrapes skip
+    the Chrome boot and chromedriver handshake.
+
+    Drivers are created lazily by `setup` and checked out with acquire().
+    Cookies and local storage are cleared before a driver goes back to the
+    pool; drivers that fail or no longer respond are closed with `close`.
+    """
+
+    def __init__(self, setup, close, size=1):
+        self._setup = setup
+        self._close = close
+        self._idle = queue.Queue(maxsize=size)
+        self._slots = threading.BoundedSemaphore(size)
+        atexit.register(self.shutdown)
+        # Pool worker processes leave via os._exit and skip atexit handlers
+        mp_util.Finalize(None, self.shutdown, exitpriority=10)
+
+    @contextmanager
+    def acquire(self):
+        with self._slots:
+            driver = self._checkout()
+            try:
+                yield driver
+            except Exception:
+                self._close(driver)
+                raise
+            else:
+                self._release(driver)
+
+    def _checkout(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return self._setup()
+            try:
+                driver.current_url  # still responding?
+                return driver
+            except Exception:
+                logger.warning("Discarding dead pooled WebDriver")
+                self._close(driver)
+
+    def _release(self, driver):
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear();")
+            driver.get("about:blank")
+            self._idle.put_nowait(driver)
+        except Exception:
+            self._close(driver)
+
+    def shutdown(self):
+        """Quit every idle driver (and its temp profile); registered with atexit."""
+        while True:
+            try:
+                self._close(self._idle.get_nowait())
+            except queue.Empty:
+                break
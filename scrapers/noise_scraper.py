@@ -1,39 +1,157 @@
 import os
-import csv
+import functools
+import re
 import time
-import platform
 import argparse
+import queue
+import atexit
 import logging
 import tempfile
 import shutil
+import pandas as pd
+import requests
+import lxml.html
+from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from itertools import repeat
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException, TimeoutException, WebDriverException
+
+try:
+    from scrapers.driver_pool import DriverPool
+    from scrapers.csv_sink import OUTPUT_FORMATS, open_sink
+    from scrapers.browser import (CHROME_PREFS, CHROME_BIN, CHROMEDRIVER_BIN, IS_LINUX, block_heavy_resources,
+                                  ensure_executable, first_element, managed_driver_path)
+    from scrapers.disk_cache import cache_args, claim_cache_dir
+except ImportError:  # run as a script: python scrapers/<brand>_scraper.py
+    from driver_pool import DriverPool
+    from csv_sink import OUTPUT_FORMATS, open_sink
+    from browser import (CHROME_PREFS, CHROME_BIN, CHROMEDRIVER_BIN, IS_LINUX, block_heavy_resources,
+                         ensure_executable, first_element, managed_driver_path)
+    from disk_cache import cache_args, claim_cache_dir
 
 # Logging setup
 logger = logging.getLogger("noise_scraper")
-logger.setLevel(logging.DEBUG)
+# DEBUG records are only built when SCRAPER_LOG_LEVEL=DEBUG
+logger.setLevel(os.environ.get("SCRAPER_LOG_LEVEL", "INFO").upper())
 formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
+os.makedirs("logs", exist_ok=True)
 fh = logging.FileHandler("logs/noise_scraper.log")
 fh.setLevel(logging.DEBUG)
 fh.setFormatter(formatter)
-logger.addHandler(fh)
 
 ch = logging.StreamHandler()
 ch.setLevel(logging.INFO)
 ch.setFormatter(formatter)
-logger.addHandler(ch)
+
+# Threads only enqueue records; one listener thread does the file and console I/O
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, fh, ch, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)  # flush what is still queued
+queue_handler = QueueHandler(log_queue)
+logger.addHandler(queue_handler)
+
+# Parallel product-page extraction: one headless Chrome per worker thread, from the driver pool
+BROWSER_WORKERS = int(os.environ.get("NOISE_BROWSER_WORKERS", 4))
+
+# Tabs per worker browser: the next product loads in one while the current one is scraped
+BROWSER_TABS = 2
+
+# Plain HTTP session for listing pages; pooled connections serve the subcategory fan-out
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept-Language": "en-IN,en;q=0.9",
+}
+_SESSION = requests.Session()
+_SESSION.headers.update(HTTP_HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+SUBCATEGORY_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' explore-categories ')]//a[contains(@href, '/collections/')]/@href"
+PRODUCT_LINK_XPATH = "//a[contains(@href, '/products/')]/@href"
+
+# Output tables and their columns
+CSV_FIELDS = {
+    "products": ["brand", "category_id", "product_id", "title", "price", "main_price", "discount", "rating", "link"],
+    "features": ["product_id", "feature"],
+    "reviews": ["product_id", "author", "rating", "title", "body"],
+    "specifications": ["product_id", "key", "value"],
+    "faqs": ["product_id", "question", "answer"],
+}
+
+# Element locators and wait conditions, built once instead of per call
+SUBCATEGORY_CSS = "div.explore-categories a[href*='/collections/']"
+PRODUCT_LINK_CSS = "a[href*='/products/']"
+SUBCATEGORY_LOC = (By.CSS_SELECTOR, SUBCATEGORY_CSS)
+PRODUCT_LINKS_PRESENT = EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_LINK_CSS))
+TITLE_PRESENT = EC.presence_of_element_located((By.CLASS_NAME, "product-title"))
+PRICE_PRESENT = EC.presence_of_element_located((By.CLASS_NAME, "product-actual-price"))
+SPEC_HEADER_LOC = (By.CLASS_NAME, "product-specification-accordion__header")
+SPEC_CONTENT_LOC = (By.XPATH, "./following-sibling::div")
+FAQ_PANEL_LOC = (By.CLASS_NAME, "faq-panel")
+FAQ_PANEL_PRESENT = EC.presence_of_element_located(FAQ_PANEL_LOC)
+FAQ_TITLE_LOC = (By.CLASS_NAME, "ques-title")
+FAQ_ANSWER_LOC = (By.CLASS_NAME, "answer")
+PARAGRAPH_LOC = (By.TAG_NAME, "p")
+REVIEW_LOC = (By.CLASS_NAME, "jdgm-rev")
+LOAD_MORE_LOC = (By.CLASS_NAME, "jdgm-rev-widg__load-more")
+
+# Start loading a URL in the current tab without waiting; the old document is marked stale
+PREFETCH_JS = "window.__stale = true; window.location.href = arguments[0];"
+
+def prefetched_page_loaded(driver):
+    """Wait condition: the tab has left its stale document and finished loading the new one."""
+    try:
+        return driver.execute_script("return !window.__stale && document.readyState === 'complete';")
+    except WebDriverException:  # mid-navigation, no document to run in yet
+        return False
+
+# In-page extraction scripts: one WebDriver round trip instead of one per element
+HREFS_JS = """
+return Array.from(new Set(Array.from(document.querySelectorAll(arguments[0]), a => a.href)));
+"""
+
+PRODUCT_FIELDS_JS = """
+const text = cls => {
+    const el = document.getElementsByClassName(cls)[0];
+    return el ? el.innerText.trim() : null;
+};
+return {
+    title: text('product-title'),
+    price: text('product-actual-price'),
+    main_price: text('product-compare-price'),
+    rating: text('review-text'),
+    features: Array.from(document.getElementsByClassName('feature-name'), el => el.innerText.trim()),
+};
+"""
+
+REVIEWS_JS = """
+return Array.from(document.getElementsByClassName('jdgm-rev'), rev => {
+    const q = cls => rev.getElementsByClassName(cls)[0];
+    const author = q('jdgm-rev__author'), date = q('jdgm-rev__timestamp'), rating = q('jdgm-rev__rating'),
+          title = q('jdgm-rev__title'), body = q('jdgm-rev__body');
+    if (!(author && date && rating && title && body)) return null;
+    return {
+        author: author.innerText.trim(),
+        date: date.getAttribute('data-content'),
+        rating: rating.getAttribute('data-score'),
+        title: title.innerText.trim(),
+        body: body.innerText.trim(),
+    };
+});
+"""
 
 def setup_driver():
     """Setup Selenium Chrome WebDriver for Linux server with temporary profile."""
-    system_platform = platform.system().lower()
     tmp_dir = tempfile.mkdtemp()
     driver = None
 
@@ -46,153 +164,300 @@ def setup_driver():
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
         options.add_argument(f"--user-data-dir={tmp_dir}")
-
-        if system_platform == 'linux':
-            chrome_path = "/usr/bin/google-chrome"
-            chromedriver_path = "/root/new_dataextraction/linux_browser/chromedriver/chromedriver"
-            if not os.path.exists(chrome_path) or not os.path.exists(chromedriver_path):
-                raise FileNotFoundError("Chrome or Chromedriver not found in Linux paths.")
+        options.add_experimental_option("prefs", CHROME_PREFS)
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        # Fresh profile per browser, but the HTTP cache persists across runs
+        cache_dir, cache_lock = claim_cache_dir("noise")
+        if cache_dir:
+            for arg in cache_args(cache_dir):
+                options.add_argument(arg)
+
+        if IS_LINUX:
+            chrome_path, chromedriver_path = CHROME_BIN, CHROMEDRIVER_BIN
+            ensure_executable(chrome_path, chromedriver_path,
+                               missing_msg="Chrome or Chromedriver not found in Linux paths.")
             options.binary_location = chrome_path
             service = Service(chromedriver_path)
 
-            os.chmod(chrome_path, 0o755)
-            os.chmod(chromedriver_path, 0o755)
-            
         else:
-            from webdriver_manager.chrome import ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
+            service = Service(managed_driver_path())
 
         driver = webdriver.Chrome(service=service, options=options)
         driver.temp_profile_dir = tmp_dir
+        driver.cache_lock = cache_lock
+        block_heavy_resources(driver)
         logger.info("WebDriver initialized successfully")
         return driver
 
     except Exception as e:
         logger.exception("Failed to initialize WebDriver")
+        if cache_lock:
+            cache_lock.close()
         shutil.rmtree(tmp_dir, ignore_errors=True)
         raise
 
-def parse_price(text):
+def close_driver(driver):
+    """Quit the browser and remove its temporary profile directory."""
     try:
-        return float(text.replace("₹", "").replace(",", "").strip())
-    except:
-        return 0.0
+        driver.quit()
+        logger.info("Browser closed.")
+    except Exception as e:  # crashed or hung browser; its cache slot and profile still go
+        logger.warning("Error closing WebDriver: %s", e)
+    finally:
+        if getattr(driver, "cache_lock", None):
+            driver.cache_lock.close()  # frees the disk cache slot for the next browser
+        if hasattr(driver, "temp_profile_dir"):
+            shutil.rmtree(driver.temp_profile_dir, ignore_errors=True)
+            logger.info("Temporary Chrome profile cleaned up.")
+
+@functools.lru_cache(maxsize=None)
+def driver_pool(size=BROWSER_WORKERS):
+    """Pool of up to `size` warm drivers, shared by every scrape() in this process asking for that size."""
+    return DriverPool(setup_driver, close_driver, size=max(1, size))
+
+# First number in a price label ("₹1,299", "Rs. 999.00"); thousands separators are dropped
+_PRICE_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+
+def parse_price(text):
+    match = _PRICE_RE.search(text) if text else None
+    return float(match.group().replace(",", "")) if match else 0.0
     
-def scroll_to_end(driver):
+def scroll_to_end(driver, max_scrolls=50):
     """Scroll to bottom until page fully loads."""
     last_height = driver.execute_script("return document.body.scrollHeight")
-    while True:
+    for _ in range(max_scrolls):
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
+        try:
+            WebDriverWait(driver, 5).until(
+                lambda d: d.execute_script("return document.body.scrollHeight") != last_height)
+        except TimeoutException:
             break
-        last_height = new_height
+        last_height = driver.execute_script("return document.body.scrollHeight")
 
 def collect_product_links(driver, wait, url):
-    logger.info(f"Scraping product links from {url}")
+    logger.info("Scraping product links from %s", url)
     driver.get(url)
     time.sleep(3)
     links = set()
 
     try:
-        subcats = driver.find_elements(By.CSS_SELECTOR, "div.explore-categories a[href*='/collections/']")
+        subcats = driver.find_elements(*SUBCATEGORY_LOC)
         if subcats:
-            logger.info(f"Found {len(subcats)} subcategories")
-            sub_urls = list(set(a.get_attribute("href") for a in subcats))
+            logger.info("Found %s subcategories", len(subcats))
+            sub_urls = driver.execute_script(HREFS_JS, SUBCATEGORY_CSS)
             for sub_url in sub_urls:
                 driver.get(sub_url)
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                 time.sleep(3)
                 try:
-                    products = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a[href*='/products/']")))
-                    links.update(p.get_attribute("href") for p in products if "/products/" in p.get_attribute("href"))
+                    wait.until(PRODUCT_LINKS_PRESENT)
+                    links.update(h for h in driver.execute_script(HREFS_JS, PRODUCT_LINK_CSS) if "/products/" in h)
                 except Exception as e:
-                    logger.error(f"Error in {sub_url}: {e}")
+                    logger.error("Error in %s: %s", sub_url, e)
         else:
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             time.sleep(3)
-            products = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a[href*='/products/']")))
-            links.update(p.get_attribute("href") for p in products if "/products/" in p.get_attribute("href"))
+            wait.until(PRODUCT_LINKS_PRESENT)
+            links.update(h for h in driver.execute_script(HREFS_JS, PRODUCT_LINK_CSS) if "/products/" in h)
 
     except Exception as e:
-        logger.exception(f"Failed to collect product links from {url}")
+        logger.exception("Failed to collect product links from %s", url)
 
     return list(links)
 
-def extract_product_details(driver, wait, links, category_id, brand):
-    logger.info(f"Extracting product details for brand {brand}, category {category_id}")
-    products = []
+def _fetch_hrefs(url, xpath):
+    response = _SESSION.get(url, timeout=20)
+    response.raise_for_status()
+    tree = lxml.html.fromstring(response.content)
+    return [urljoin(response.url, href) for href in tree.xpath(xpath)]
 
-    for idx, link in enumerate(links):
-        driver.get(link)
-        pid = f"{category_id}_product_{idx+1}"
+def _fetch_links_static(url):
+    """Collect product links from the server-rendered HTML, without a browser."""
+    links = set()
+    try:
+        sub_urls = list(dict.fromkeys(_fetch_hrefs(url, SUBCATEGORY_XPATH)))
+        for page_url in sub_urls or [url]:
+            links.update(_fetch_hrefs(page_url, PRODUCT_LINK_XPATH))
+    except Exception as e:
+        logger.warning("Static link fetch failed for %s: %s", url, e)
+        return []
+    return list(links)
+
+def find_product_links(url, workers=BROWSER_WORKERS):
+    """Try the static fetch first; use Selenium only if the listing is rendered client-side."""
+    links = _fetch_links_static(url)
+    if links:
+        return links
+    logger.info("No product links in static HTML of %s, falling back to Selenium", url)
+    with driver_pool(workers).acquire() as driver:
+        return collect_product_links(driver, WebDriverWait(driver, 30), url)
+
+def extract_product(driver, wait, idx, link, category_id, brand, prefetched=False):
+    """
+    Scrape one product page; returns the product dict or None on failure.
+    With `prefetched`, the current tab is already loading `link` (see prefetch_tab).
+    """
+    pid = f"{category_id}_product_{idx+1}"
+    try:
+        if prefetched:
+            wait.until(prefetched_page_loaded)
+        else:
+            driver.get(link)
+        wait.until(TITLE_PRESENT)
+        wait.until(PRICE_PRESENT)
+        fields = driver.execute_script(PRODUCT_FIELDS_JS)
+        title, price = fields["title"], fields["price"]
+        main_price = fields["main_price"] if fields["main_price"] is not None else "N/A"
+        rating = fields["rating"] if fields["rating"] is not None else "N/A"
+
+        discount = "N/A"
+        price_val = parse_price(price)
+        main_val = parse_price(main_price)
+        if main_val > 0:
+            discount = f"{round(((main_val - price_val) / main_val) * 100)}%"
+
+        return {
+            "product_id": pid,
+            "title": title,
+            "price": price,
+            "main_price": main_price,
+            "discount": discount,
+            "rating": rating,
+            "link": link,
+            "brand": brand,
+            "category_id": category_id,
+            "features": fields["features"],
+            "specifications": extract_specifications(driver),
+            "faqs": extract_faqs(driver),
+            "reviews": extract_reviews(driver)
+        }
+    except Exception as e:
+        logger.error("Failed for %s: %s", link, e)
+        return None
+
+def _tab_handles(driver, count=BROWSER_TABS):
+    """Window handles of `count` tabs in this browser, opening the missing ones."""
+    handles = getattr(driver, "tab_handles", None)
+    if handles is None:
+        first = driver.current_window_handle
+        handles = [first]
+        for _ in range(count - 1):
+            driver.switch_to.new_window("tab")
+            block_heavy_resources(driver)
+            handles.append(driver.current_window_handle)
+        driver.switch_to.window(first)
+        driver.tab_handles = handles
+    return handles
+
+def prefetch_tab(driver, handle, link):
+    """Start `link` loading in tab `handle`, then return to the current tab."""
+    current = driver.current_window_handle
+    driver.switch_to.window(handle)
+    driver.execute_script(PREFETCH_JS, link)
+    driver.switch_to.window(current)
+
+def _process_slice(pool, slice_and_meta):
+    """
+    Worker thread: scrape a run of (index, link) items on one pooled browser.
+    Each product page is loaded in a spare tab while the one before it is scraped,
+    so the renderer and HTTP cache stay warm and page loads overlap extraction.
+    """
+    items, category_id, brand = slice_and_meta
+    with pool.acquire() as driver:
+        wait = WebDriverWait(driver, 30)
+        products = []
         try:
-            title = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "product-title"))).text
-            price = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "product-actual-price"))).text
-            main_price = driver.find_element(By.CLASS_NAME, "product-compare-price").text if driver.find_elements(By.CLASS_NAME, "product-compare-price") else "N/A"
-            rating = driver.find_elements(By.CLASS_NAME, "review-text")[0].text if driver.find_elements(By.CLASS_NAME, "review-text") else "N/A"
-            
-            discount = "N/A"
-            price_val = parse_price(price)
-            main_val = parse_price(main_price)
-            if main_val > 0:
-                discount = f"{round(((main_val - price_val) / main_val) * 100)}%"
-
-            products.append({
-                "product_id": pid,
-                "title": title,
-                "price": price,
-                "main_price": main_price,
-                "discount": discount,
-                "rating": rating,
-                "link": link,
-                "brand": brand,
-                "category_id": category_id,
-                "features": [el.text for el in driver.find_elements(By.CLASS_NAME, "feature-name")],
-                "specifications": extract_specifications(driver),
-                "faqs": extract_faqs(driver),
-                "reviews": extract_reviews(driver)
-            })
+            handles = _tab_handles(driver)
         except Exception as e:
-            logger.error(f"Failed for {link}: {e}")
-
-    return products
+            logger.warning("Could not open prefetch tabs, loading pages one at a time: %s", e)
+            handles = None
+
+        if not handles or len(handles) < 2:
+            for idx, link in items:
+                products.append(extract_product(driver, wait, idx, link, category_id, brand))
+            return [p for p in products if p]
+
+        prefetched = False
+        for i, (idx, link) in enumerate(items):
+            next_item = items[i + 1] if i + 1 < len(items) else None
+            next_prefetched = False
+            try:
+                driver.switch_to.window(handles[i % len(handles)])
+                if next_item:
+                    prefetch_tab(driver, handles[(i + 1) % len(handles)], next_item[1])
+                    next_prefetched = True
+            except WebDriverException as e:
+                logger.warning("Tab prefetch failed before %s: %s", link, e)
+            products.append(extract_product(driver, wait, idx, link, category_id, brand, prefetched=prefetched))
+            prefetched = next_prefetched
+        return [p for p in products if p]
+
+def extract_product_details(links, category_id, brand, tables=None, workers=BROWSER_WORKERS):
+    """
+    Scrape product pages on up to `workers` pooled browsers, handing each product's rows to
+    `tables` (table name -> list or sink) in link order as soon as they are ready.
+    """
+    logger.info("Extracting product details for brand %s, category %s", brand, category_id)
+    if tables is None:
+        tables = {name: [] for name in CSV_FIELDS}
+    if not links:
+        return tables
+    pool = driver_pool(workers)
+    workers = max(1, min(workers, len(links)))
+    # Each worker takes a run of links at a time so its tabs can prefetch within the run
+    size = max(BROWSER_TABS, len(links) // (workers * 4))
+    items = list(enumerate(links))
+    slices = [items[i:i + size] for i in range(0, len(items), size)]
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for products in ex.map(functools.partial(_process_slice, pool),
+                               zip(slices, repeat(category_id), repeat(brand))):
+            for product in products:
+                add_product(tables, product)
+    return tables
 
 def extract_specifications(driver):
     specs = {}
     try:
-        for section in driver.find_elements(By.CLASS_NAME, "product-specification-accordion__header"):
+        for section in driver.find_elements(*SPEC_HEADER_LOC):
             title = section.text.strip()
             section.click()
             time.sleep(1)
-            content = section.find_element(By.XPATH, "./following-sibling::div").text.strip()
+            content = section.find_element(*SPEC_CONTENT_LOC).text.strip()
             specs[title] = content
     except:
         pass
     return specs
 
-def extract_faqs(driver, wait_time=2):
+def extract_faqs(driver, wait_time=3):
     faqs = []
     try:
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "faq-panel"))
-        )
-        total_panels = len(driver.find_elements(By.CLASS_NAME, "faq-panel"))
+        WebDriverWait(driver, 10).until(FAQ_PANEL_PRESENT)
+        # One lookup for all panels; a panel is re-fetched only if its click re-renders it
+        panels = driver.find_elements(*FAQ_PANEL_LOC)
 
-        for i in range(total_panels):
+        for i, section in enumerate(panels):
             try:
-                section = driver.find_elements(By.CLASS_NAME, "faq-panel")[i]
-                ActionChains(driver).move_to_element(section).perform()
-                time.sleep(0.5)
-                section.click()
-                time.sleep(wait_time)
-
-                section = driver.find_elements(By.CLASS_NAME, "faq-panel")[i]
-                title = section.find_element(By.CLASS_NAME, "ques-title").text.strip()
-                answer_sec = section.find_element(By.CLASS_NAME, "answer")
+                # Click the question header (where a real click would land) without mouse emulation
+                toggle = first_element(section, *FAQ_TITLE_LOC) or section
+                driver.execute_script("arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", toggle)
+                try:
+                    WebDriverWait(driver, wait_time, ignored_exceptions=(StaleElementReferenceException,)).until(
+                        lambda d: (el := first_element(section, *FAQ_ANSWER_LOC)) is not None and el.is_displayed())
+                except TimeoutException:
+                    pass  # read whatever the panel shows
 
-                p_tags = answer_sec.find_elements(By.TAG_NAME, "p")
+                try:
+                    title_el = first_element(section, *FAQ_TITLE_LOC)
+                except StaleElementReferenceException:
+                    section = driver.find_elements(*FAQ_PANEL_LOC)[i]
+                    title_el = first_element(section, *FAQ_TITLE_LOC)
+                answer_sec = first_element(section, *FAQ_ANSWER_LOC)
+                if title_el is None or answer_sec is None:
+                    continue
+                title = title_el.text.strip()
+
+                p_tags = answer_sec.find_elements(*PARAGRAPH_LOC)
                 q, a_parts = None, []
                 for p in p_tags:
                     html = p.get_attribute("innerHTML").strip()
@@ -210,7 +475,7 @@ def extract_faqs(driver, wait_time=2):
                     faqs.append({"faq_title": title, "question": q, "answer": " ".join(a_parts)})
 
             except Exception as e:
-                logger.warning(f"FAQ panel {i} failed: {e}")
+                logger.warning("FAQ panel %s failed: %s", i, e)
     except Exception as e:
         logger.warning("No FAQ section found or timeout")
 
@@ -220,54 +485,48 @@ def extract_reviews(driver):
     reviews = []
     try:
         while True:
-            load_more = driver.find_elements(By.CLASS_NAME, "jdgm-rev-widg__load-more")
+            load_more = driver.find_elements(*LOAD_MORE_LOC)
             if not load_more:
                 break
+            count = len(driver.find_elements(*REVIEW_LOC))
             driver.execute_script("arguments[0].click();", load_more[0])
-            time.sleep(2)
-
-        for review in driver.find_elements(By.CLASS_NAME, "jdgm-rev"):
             try:
-                reviews.append({
-                    "author": review.find_element(By.CLASS_NAME, "jdgm-rev__author").text.strip(),
-                    "date": review.find_element(By.CLASS_NAME, "jdgm-rev__timestamp").get_attribute("data-content"),
-                    "rating": review.find_element(By.CLASS_NAME, "jdgm-rev__rating").get_attribute("data-score"),
-                    "title": review.find_element(By.CLASS_NAME, "jdgm-rev__title").text.strip(),
-                    "body": review.find_element(By.CLASS_NAME, "jdgm-rev__body").text.strip(),
-                })
-            except Exception as e:
-                logger.warning(f"Skipped a review due to: {e}")
+                WebDriverWait(driver, 5).until(
+                    lambda d: len(d.find_elements(*REVIEW_LOC)) > count)
+            except TimeoutException:
+                break
+
+        extracted = driver.execute_script(REVIEWS_JS)
+        reviews = [r for r in extracted if r]
+        if len(reviews) < len(extracted):
+            logger.warning("Skipped %s reviews with missing fields", len(extracted) - len(reviews))
 
     except Exception as e:
-        logger.warning(f"Failed to load reviews: {e}")
+        logger.warning("Failed to load reviews: %s", e)
     return reviews
 
-def save_to_csv(products, brand, category_id):
-    folder = os.path.join("data", brand.lower())
-    os.makedirs(folder, exist_ok=True)
-    prefix = f"{brand.lower()}_{category_id}"
+def add_product(tables, product):
+    """Split one scraped product dict into rows of the per-table lists or sinks."""
+    pid = product["product_id"]
+    tables["products"].append({field: product[field] for field in CSV_FIELDS["products"]})
+    tables["features"].extend({"product_id": pid, "feature": f} for f in product.get("features", []))
+    tables["reviews"].extend({"product_id": pid, **r} for r in product.get("reviews", []))
+    tables["specifications"].extend({"product_id": pid, "key": k, "value": v}
+                                    for k, v in product.get("specifications", {}).items())
+    tables["faqs"].extend({"product_id": pid, **f} for f in product.get("faqs", []))
+
+def scrape(url, category_id, brand, workers=BROWSER_WORKERS):
+    """
+    Scrape one category and return its tables as DataFrames keyed like the CSV files.
+    At most `workers` browsers run at once.
+    """
+    links = find_product_links(url, workers)
+    logger.info("Collected %s links", len(links))
+
+    # A link-collection driver is back in the pool and serves as one of the workers
+    tables = extract_product_details(links, category_id, brand, workers=workers)
+    return {name: pd.DataFrame(rows, columns=CSV_FIELDS[name]) for name, rows in tables.items()}
 
-    def write_csv(name, header, rows):
-        with open(os.path.join(folder, f"{prefix}_{name}.csv"), "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(header)
-            writer.writerows(rows)
-
-    write_csv("products", ["brand", "category_id", "product_id", "title", "price", "main_price", "discount", "rating", "link"],
-              [[p["brand"], p["category_id"], p["product_id"], p["title"], p["price"], p["main_price"], p["discount"], p["rating"], p["link"]] for p in products])
-
-    write_csv("features", ["product_id", "feature"],
-              [[p["product_id"], f] for p in products for f in p.get("features", [])])
-
-    write_csv("reviews", ["product_id", "author", "rating", "title", "body"],
-              [[p["product_id"], r["author"], r["rating"], r["title"], r["body"]] for p in products for r in p.get("reviews", [])])
-
-    write_csv("specifications", ["product_id", "key", "value"],
-              [[p["product_id"], k, v] for p in products for k, v in p.get("specifications", {}).items()])
-
-    write_csv("faqs", ["product_id", "question", "answer"],
-              [[p["product_id"], f["question"], f["answer"]] for p in products for f in p.get("faqs", [])])
-    
 
 # -------------------
 # Main
@@ -277,28 +536,26 @@ if __name__ == "__main__":
     parser.add_argument("--url", required=True)
     parser.add_argument("--category_id", required=True)
     parser.add_argument("--brand", required=True)
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv", help="Output file format")
+    parser.add_argument("--workers", "--max-concurrency", type=int, default=BROWSER_WORKERS,
+                        help="Browsers running at once")
     args = parser.parse_args()
 
-    driver = setup_driver()
-    wait = WebDriverWait(driver, 30)
-
     try:
         logger.info("Collecting product links...")
-        links = collect_product_links(driver, wait, args.url)
-        logger.info(f"Collected {len(links)} links")
+        links = find_product_links(args.url, args.workers)
+        logger.info("Collected %s links", len(links))
 
+        # Rows go straight to disk as each product finishes
         logger.info("Extracting product details...")
-        products = extract_product_details(driver, wait, links, args.category_id, args.brand)
-
-        logger.info("Saving data to CSV...")
-        save_to_csv(products, args.brand, args.category_id)
+        folder = os.path.join("data", args.brand.lower())
+        os.makedirs(folder, exist_ok=True)
+        prefix = f"{args.brand.lower()}_{args.category_id}"
+        with ExitStack() as stack:
+            sinks = {name: stack.enter_context(open_sink(os.path.join(folder, f"{prefix}_{name}"), fields, args.format))
+                     for name, fields in CSV_FIELDS.items()}
+            extract_product_details(links, args.category_id, args.brand, sinks, workers=args.workers)
+        logger.info("Data saved to CSV.")
 
     except Exception as e:
-        logger.exception("Script failed")
-    finally:
-        if driver:
-            driver.quit()
-            logger.info("Browser closed.")
-            if hasattr(driver, "temp_profile_dir"):
-                shutil.rmtree(driver.temp_profile_dir, ignore_errors=True)
-                logger.info("Temporary Chrome profile cleaned up.")
\ No newline at end of file
+        logger.exception("Script failed")
\ No newline at end of file
@@ -0,0 +1,70 @@
+import json
+import pathlib
+import shutil
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from scrapers import boult_scraper
+
+FIXTURES = pathlib.Path(__file__).parent / "fixtures"
+PAGE = FIXTURES / "boult_product.html"
+# What PRODUCT_FIELDS_JS returns for PAGE in Chrome
+BROWSER_FIELDS = json.loads((FIXTURES / "boult_product_fields.json").read_text(encoding="utf-8"))
+
+TASK = (1, "category_1_product_1", "https://www.boultaudio.com/products/z40-pro", 1,
+        {"category_id": "category_1", "brand": "boult"})
+
+
+class _RecordedDriver:
+    """Stands in for Chrome on PAGE: answers PRODUCT_FIELDS_JS with BROWSER_FIELDS."""
+
+    def get(self, url):
+        pass
+
+    def find_element(self, by, value):
+        return object()
+
+    def find_elements(self, by, value):
+        return []  # FAQs are compared on the static path only
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {"result": {"value": BROWSER_FIELDS}}
+
+
+def test_static_rows_match_browser_rows(monkeypatch):
+    monkeypatch.setattr(boult_scraper, "load_reviews", lambda driver, wait, product_id: None)
+    browser = boult_scraper._scrape_one(_RecordedDriver(), *TASK)
+    static = boult_scraper._parse_static(PAGE.read_bytes(), *TASK)
+
+    assert static is not None
+    # products, features, specifications, reviews
+    assert static[:4] == browser[:4]
+    assert static[4] == [{"product_id": "category_1_product_1", "question": "Is it waterproof?",
+                          "answer": "IPX5 sweat and splash resistant."}]
+
+
+def test_static_text_follows_inner_text():
+    products, features, specifications, reviews, _ = boult_scraper._parse_static(PAGE.read_bytes(), *TASK)
+
+    assert products[0]["title"] == "Boult Z40 Pro"  # whitespace collapsed
+    assert "Zen™ ENC Mic\nClear calls" in [f["feature"] for f in features]  # <br> kept
+    assert '<img src="/icons/anc.png" alt="ANC">' in [f["feature"] for f in features]  # no text: innerHTML
+    assert reviews[0]["body"] == "Great sound.\nBattery lasts."
+
+
+@pytest.mark.skipif(not (shutil.which("google-chrome") or shutil.which("chromium")), reason="needs Chrome")
+def test_recorded_fields_match_chrome():
+    from selenium import webdriver
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    try:
+        driver = webdriver.Chrome(options=options)
+    except WebDriverException as e:
+        pytest.skip(f"Chrome did not start: {e}")
+    try:
+        driver.get(PAGE.as_uri())
+        assert boult_scraper.evaluate_js(driver, boult_scraper.PRODUCT_FIELDS_JS) == BROWSER_FIELDS
+    finally:
+        driver.quit()
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from preprocessor import csv_io
+
+
+RAW = "product_id,price,title\np1,999,Airdopes\np2,N/A,\np3,1299,NA\n"
+
+
+@pytest.fixture
+def raw_csv(tmp_path):
+    path = tmp_path / "boat_category_1_products.csv"
+    path.write_text(RAW, encoding="utf-8")
+    return path
+
+
+def test_read_csv_gives_numpy_columns_with_placeholders_missing(raw_csv):
+    df = csv_io.read_csv(raw_csv)
+
+    assert df["price"].dtype == np.float64
+    assert df["title"].dtype == object
+    assert df["price"].isna().tolist() == [False, True, False]
+    assert df["title"].isna().tolist() == [False, True, True]
+
+
+def test_load_frame_normalizes_frames_like_a_csv_round_trip():
+    scraped = pd.DataFrame({
+        "product_id": ["p1", "p2", "p3"],
+        "price": ["999", "N/A", "1299"],
+        "title": ["Airdopes", "", "NA"],
+    })
+    frame = csv_io.load_frame(scraped)
+
+    assert frame["title"].isna().tolist() == [False, True, True]
+    assert frame["price"].isna().tolist() == [False, True, False]
+    assert scraped["title"].tolist() == ["Airdopes", "", "NA"]  # the scraper's frame is left alone
+
+
+def test_write_then_append_round_trips(tmp_path):
+    path = tmp_path / "out.csv"
+    first = pd.DataFrame({"product_id": ["p1"], "rating": [5]})
+    second = pd.DataFrame({"product_id": ["p2"], "rating": [4]})
+    csv_io.write_csv(first, path)
+    csv_io.append_csv(second, path)
+
+    assert pd.read_csv(path).to_dict("list") == {"product_id": ["p1", "p2"], "rating": [5, 4]}
+
+
+def test_as_text_blanks_missing_values():
+    text = csv_io.as_text(pd.Series([1.5, np.nan, None]))
+
+    assert text.tolist() == ["1.5", "", ""]
+
+
+def test_as_text_returns_string_columns_as_is():
+    series = pd.Series(["a", "b"])
+
+    assert csv_io.as_text(series) is series
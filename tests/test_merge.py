@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+import app
+
+
+@pytest.fixture
+def merged_folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "MERGED_FOLDER", str(tmp_path / "merged_data"))
+    monkeypatch.setattr(app, "MERGED_FORMAT", "csv")
+    return tmp_path / "merged_data"
+
+
+def _products(rows):
+    columns = ["brand", "category_id", "product_id", "title", "price", "link"]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def _merge(df, table, brand="boat", category_id="category_1"):
+    merged_path = app.append_to_merged(df, f"{brand}_{category_id}_{table}.csv", brand)
+    if merged_path:
+        app.flush_merged_path(merged_path)
+    app.compact_merged(brand, appended_only=True)
+
+
+def test_repeated_product_ids_keep_distinct_products(merged_folder):
+    # product_id is a list position, so earlier scrapes reused it for other links
+    existing = _products([
+        ["boat", "category_1", "category_1_product_1", "airdopes 141", 999, "https://x/airdopes-141"],
+        ["boat", "category_1", "category_1_product_1", "rockerz 255", 1299, "https://x/rockerz-255"],
+        ["boat", "category_1", "category_1_product_2", "stone 350", 1499, "https://x/stone-350"],
+    ])
+    _merge(existing, "products")
+
+    scrape = _products([
+        ["boat", "category_1", "category_1_product_1", "nirvana ion", 2499, "https://x/nirvana-ion"],
+        ["boat", "category_1", "category_1_product_2", "stone 350", 1499, "https://x/stone-350"],
+    ])
+    _merge(scrape, "products")
+
+    merged = pd.read_csv(merged_folder / "boat_merged" / "boat_products.csv")
+    assert sorted(merged["link"]) == sorted([
+        "https://x/airdopes-141", "https://x/rockerz-255", "https://x/stone-350", "https://x/nirvana-ion",
+    ])
+    assert len(merged) == 4  # the unchanged stone 350 row is not repeated
+
+
+def test_rescraping_child_table_does_not_grow_merged_file(merged_folder):
+    reviews = pd.DataFrame({
+        "product_id": ["category_1_product_1"] * 2,
+        "author": ["anonymous", "anonymous"],
+        "rating": [5, 4],
+        "title": ["good product", "good product"],
+        "body": ["great bass", "battery could be better"],
+    })
+    _merge(reviews, "reviews")
+    _merge(reviews, "reviews")  # appended, then compacted at the end of the job
+
+    merged = pd.read_csv(merged_folder / "boat_merged" / "boat_reviews.csv")
+    assert len(merged) == 2
+
+
+def test_write_merged_drops_repeats_and_sorts_by_category(merged_folder):
+    merged_folder.mkdir()
+    path = merged_folder / "boat_products.csv"
+    combined = _products([
+        ["boat", "category_2", "category_2_product_1", "stone 350", 1499, "https://x/stone-350"],
+        ["boat", "category_1", "category_1_product_1", "airdopes 141", 999, "https://x/airdopes-141"],
+        ["boat", "category_2", "category_2_product_1", "stone 350", 1499, "https://x/stone-350"],
+    ])
+    app._write_merged(combined, str(path))
+
+    merged = pd.read_csv(path)
+    assert merged["category_id"].tolist() == ["category_1", "category_2"]
+    assert merged["link"].tolist() == ["https://x/airdopes-141", "https://x/stone-350"]
+
+
+def test_new_category_merges_into_existing_parquet(merged_folder, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(app, "MERGED_FORMAT", "parquet")
+    _merge(_products([["boat", "category_2", "category_2_product_1", "stone 350", 1499, "https://x/stone-350"]]),
+           "products", category_id="category_2")
+    _merge(_products([["boat", "category_1", "category_1_product_1", "airdopes 141", 999, "https://x/airdopes-141"]]),
+           "products", category_id="category_1")
+
+    merged = pd.read_parquet(merged_folder / "boat_merged" / "boat_products.parquet")
+    assert merged["category_id"].tolist() == ["category_1", "category_2"]